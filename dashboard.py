@@ -3,15 +3,64 @@ import cv2
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QPushButton, QLabel, QVBoxLayout, QFileDialog, 
-    QHBoxLayout, QFrame, QMessageBox, QSizePolicy, QGraphicsDropShadowEffect,
-    QSlider, QLayout, QScrollArea, QMenu
+    QHBoxLayout, QFrame, QMessageBox, QSizePolicy,
+    QSlider, QLayout, QScrollArea, QMenu, QGraphicsOpacityEffect, QCheckBox
+)
+from PyQt6.QtGui import QImage, QColor, QPalette, QIcon, QPainter
+from PyQt6.QtCore import (
+    QTimer, Qt, QPropertyAnimation, QEasingCurve, QRect, QPoint, QSize, QEvent,
+    QThread, QMutex, QMutexLocker, QSignalBlocker, pyqtSignal
 )
-from PyQt6.QtGui import QImage, QPixmap, QColor, QPalette, QIcon
-from PyQt6.QtCore import QTimer, Qt, QPropertyAnimation, QEasingCurve, QRect, QPoint, QSize, QEvent
 from pathlib import Path
-from emotion_detector import EmotionDetector
+from collections import OrderedDict
 import time
 
+try:
+    # Con QOpenGLWidget la previsualización se dibuja con el motor de pintado OpenGL.
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+    OPENGL_AVAILABLE = True
+except ImportError:
+    QOpenGLWidget = QWidget
+    OPENGL_AVAILABLE = False
+
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Con la firma explícita se compila al importar (y cache=True guarda el resultado en
+    # disco), así el primer frame no paga la compilación. Se usa el layout genérico porque
+    # `dst` es una vista con el stride de filas del QImage. Con nogil el hilo de captura
+    # sigue detectando mientras la GUI copia el frame.
+    @njit('void(uint8[:, :, :], uint8[:, :, :])', cache=True, parallel=True, fastmath=True, nogil=True)
+    def bgr_to_display(src, dst):
+        """
+        Reescala `src` (vecino más cercano) y copia los bytes BGR directamente en `dst`
+        (el buffer del QImage de visualización) en una sola pasada paralela por filas.
+        """
+        src_h, src_w = src.shape[0], src.shape[1]
+        out_h, out_w = dst.shape[0], dst.shape[1]
+        for y in prange(out_h):
+            sy = y * src_h // out_h
+            for x in range(out_w):
+                sx = x * src_w // out_w
+                dst[y, x, 0] = src[sy, sx, 0]
+                dst[y, x, 1] = src[sy, sx, 1]
+                dst[y, x, 2] = src[sy, sx, 2]
+
+def format_time(seconds):
+    """Formatea segundos enteros como MM:SS."""
+    mins, secs = divmod(seconds, 60)
+    return f"{mins:02}:{secs:02}"
+
 class FlowLayout(QLayout):
     """Un layout personalizado que organiza widgets en un flujo, similar al texto."""
     def __init__(self, parent=None, margin=0, spacing=-1):
@@ -20,6 +69,11 @@ class FlowLayout(QLayout):
             self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing)
         self.itemList = []
+        # Ancho -> (altura, geometrías relativas) del último ancho consultado; Qt pregunta
+        # varias veces por el mismo ancho y al redimensionar no hace falta guardar los demás.
+        self._cache = {}
+        # minimumSize calculado en la última pasada (None hasta que se invalide el layout).
+        self._min_size = None
 
     def __del__(self):
         item = self.takeAt(0)
@@ -28,6 +82,8 @@ class FlowLayout(QLayout):
 
     def addItem(self, item):
         self.itemList.append(item)
+        self._cache.clear()
+        self._min_size = None
 
     def count(self):
         return len(self.itemList)
@@ -39,9 +95,17 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self.itemList):
+            self._cache.clear()
+            self._min_size = None
             return self.itemList.pop(index)
         return None
 
+    def invalidate(self):
+        # Qt invalida el layout cuando cambia el tamaño sugerido de algún widget.
+        self._cache.clear()
+        self._min_size = None
+        super(FlowLayout, self).invalidate()
+
     def expandingDirections(self):
         return Qt.Orientation(0)
 
@@ -60,54 +124,220 @@ class FlowLayout(QLayout):
         return self.minimumSize()
 
     def minimumSize(self):
-        size = QSize()
-        for item in self.itemList:
-            size = size.expandedTo(item.minimumSize())
-        margin, _, _, _ = self.getContentsMargins()
-        size += QSize(2 * margin, 2 * margin)
-        return size
+        if self._min_size is None:
+            size = QSize()
+            for item in self.itemList:
+                size = size.expandedTo(item.minimumSize())
+            margin, _, _, _ = self.getContentsMargins()
+            size += QSize(2 * margin, 2 * margin)
+            self._min_size = size
+        return QSize(self._min_size)
 
     def _do_layout(self, rect, test_only):
-        """La lógica principal que posiciona los widgets en el layout."""
-        x = rect.x()
-        y = rect.y()
+        """
+        La lógica principal que posiciona los widgets en el layout. El resultado se
+        guarda para el último ancho, así que las consultas repetidas solo aplican las
+        geometrías.
+        """
+        cached = self._cache.get(rect.width())
+        if cached is None:
+            self._cache.clear()
+            cached = self._cache[rect.width()] = self._compute_layout(rect.width())
+        height, geometries = cached
+        if not test_only:
+            origin = rect.topLeft()
+            for item, geometry in zip(self.itemList, geometries):
+                item.setGeometry(geometry.translated(origin))
+        return height
+
+    def _compute_layout(self, width):
+        """Calcula la altura y la geometría de cada widget relativas a (0, 0)."""
+        x = 0
+        y = 0
         line_height = 0
+        geometries = []
 
+        # El espaciado es el mismo para todos los botones: se consulta al estilo una sola vez.
+        parent = self.parentWidget()
+        style = parent.style() if parent else QApplication.style()
+        spacing = self.spacing()
+        space_x = spacing + style.layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Horizontal)
+        space_y = spacing + style.layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Vertical)
+
+        left = 0
+        right = width - 1
         for item in self.itemList:
-            style = self.parentWidget().style() if self.parentWidget() else QApplication.style()
-            space_x = self.spacing() + style.layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Horizontal)
-            space_y = self.spacing() + style.layoutSpacing(QSizePolicy.ControlType.PushButton, QSizePolicy.ControlType.PushButton, Qt.Orientation.Vertical)
-            
-            next_x = x + item.sizeHint().width() + space_x
-            if next_x - space_x > rect.right() and line_height > 0:
-                x = rect.x()
+            size_hint = item.sizeHint()
+            item_w = size_hint.width()
+            next_x = x + item_w + space_x
+            if next_x - space_x > right and line_height > 0:
+                x = left
                 y = y + line_height + space_y
-                next_x = x + item.sizeHint().width() + space_x
+                next_x = x + item_w + space_x
                 line_height = 0
 
-            if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+            geometries.append(QRect(QPoint(x, y), size_hint))
 
             x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            line_height = max(line_height, size_hint.height())
 
-        return y + line_height - rect.y()
+        return y + line_height, geometries
+
+# Detectores de rostros disponibles: (clave, título, descripción, fondo y borde al seleccionarlo).
+MODELS = (
+    ("haar", "Haar Cascade", "Ligero, rápido no muy preciso", "#3498db", "#2980b9"),
+    ("yolo", "YOLOv8n-face", "Optimizado para rostros, Lento pero preciso", "#e67e22", "#d35400"),
+    ("mediapipe", "MediaPipe", "Moderno y robusto", "#2ecc71", "#27ae60"),
+)
+
+MODEL_CHECKED_QSS = """
+    QPushButton#ModelButton[model="{key}"]:checked {{
+        background-color: {bg};
+        border-color: {border};
+        font-weight: 700;
+    }}"""
+
+# Hojas de estilo como constantes de módulo: se construyen una sola vez al importar.
+DASHBOARD_QSS = """
+    QWidget {
+        background-color: #1e1e1e;
+        color: #FFFFFF;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    }
+    QPushButton#ModelButton {
+        background-color: #2a2a2a;
+        color: #FFFFFF;
+        border: 1px solid #444444;
+        border-bottom: 3px solid #141414;
+        border-radius: 8px;
+        padding: 5px;
+        font-size: 15px;
+        font-weight: 600;
+        text-align: center;
+        min-width: 220px;
+    }
+    QPushButton#ModelButton:hover {
+        background-color: #3a3a3a;
+        border: 1px solid #555555;
+        border-bottom: 3px solid #141414;
+    }
+    QLabel#ModelTitle {
+        color: #FFFFFF;
+        font-weight: 600;
+        font-size: 15px;
+        background: transparent;
+    }
+    QLabel#ModelDesc {
+        color: #CCCCCC;
+        font-size: 11px;
+        background: transparent;
+    }
+    QPushButton#InputButton {
+        background-color: #e84118;
+        color: #FFFFFF;
+        border: none;
+        border-bottom: 3px solid #a8300f;
+        border-radius: 8px;
+        padding: 8px 20px;
+        font-size: 15px;
+        font-weight: 700;
+        height: 40px;
+        margin: 0px;
+        min-width: 120px;
+        letter-spacing: 0.02em;
+        text-align: center;
+    }
+    QPushButton#InputButton:hover {
+        background-color: #ff5c33;
+    }
+    QPushButton#InputButton[primary="true"] {
+        background-color: #e84118;
+        color: #FFFFFF;
+        font-weight: 800;
+    }
+    QPushButton#InputButton[primary="true"]:hover {
+        background-color: #ff5c33;
+    }
+    QPushButton#InputButton:checked {
+        background-color: #44bd32;
+        border-bottom: 3px solid #2f8a22;
+    }
+""" + "".join(MODEL_CHECKED_QSS.format(key=key, bg=bg, border=border)
+           for key, _, _, bg, border in MODELS)
+
+VIDEO_CONTROLS_QSS = """
+    QFrame#VideoControls {
+        background-color: #181818;
+        border: none;
+        border-radius: 10px;
+    }
+    QPushButton {
+        background-color: transparent;
+        color: #fff;
+        border: none;
+        font-size: 22px;
+        padding: 0 2px;
+        min-width: 28px;
+        min-height: 28px;
+        border-radius: 6px;
+        transition: background 0.2s;
+    }
+    QPushButton:hover {
+        background-color: #232323;
+        color: #e84118;
+    }
+    QLabel {
+        color: #fff;
+        font-size: 15px;
+        font-weight: 600;
+        min-width: 90px;
+        qproperty-alignment: AlignCenter;
+    }
+    QSlider::groove:horizontal {
+        border: none;
+        height: 6px;
+        background: #444;
+        margin: 0 0 0 0;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #e84118;
+        border: none;
+        width: 18px;
+        height: 18px;
+        margin: -6px 0;
+        border-radius: 9px;
+    }
+    QSlider::sub-page:horizontal {
+        background: #e84118;
+        border-radius: 3px;
+    }
+    QSlider::add-page:horizontal {
+        background: #222;
+        border-radius: 3px;
+    }
+"""
 
 class ModelButton(QPushButton):
-    """Botón personalizado para seleccionar los modelos de detección."""
-    def __init__(self, text, description, parent=None):
+    """
+    Botón personalizado para seleccionar los modelos de detección.
+    Los colores se definen una sola vez en la hoja de estilo del dashboard
+    mediante selectores sobre la propiedad dinámica `model`.
+    """
+    def __init__(self, text, description, model, parent=None):
         super().__init__(parent)
         self.setObjectName("ModelButton")
+        self.setProperty("model", model)
         layout = QVBoxLayout()
         layout.setSpacing(2)
         layout.setContentsMargins(8, 8, 8, 8)
 
         title = QLabel(text)
-        title.setStyleSheet("color: #FFFFFF; font-weight: 600; font-size: 15px; background: transparent;")
+        title.setObjectName("ModelTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         desc = QLabel(description)
-        desc.setStyleSheet("color: #CCCCCC; font-size: 11px; background: transparent;")
+        desc.setObjectName("ModelDesc")
         desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         desc.setWordWrap(True)
 
@@ -121,86 +351,18 @@ class ModelButton(QPushButton):
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.setMinimumWidth(220)
         self.setMinimumHeight(60)
-        self.setStyleSheet("""
-            QPushButton#ModelButton {
-                background-color: #2a2a2a;
-                color: #FFFFFF;
-                border: 1px solid #444444;
-                border-radius: 8px;
-                padding: 5px;
-                font-size: 15px;
-                font-weight: 600;
-                text-align: center;
-                min-width: 220px;
-            }
-            QPushButton#ModelButton:hover {
-                background-color: #3a3a3a;
-                border: 1px solid #555555;
-            }
-            QPushButton#ModelButton[model="haar"]:checked {
-                background-color: #3498db;
-                border-color: #2980b9;
-                font-weight: 700;
-            }
-            QPushButton#ModelButton[model="yolo"]:checked {
-                background-color: #e67e22;
-                border-color: #d35400;
-                font-weight: 700;
-            }
-            QPushButton#ModelButton[model="mediapipe"]:checked {
-                background-color: #2ecc71;
-                border-color: #27ae60;
-                font-weight: 700;
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(12)
-        shadow.setColor(QColor(0, 0, 0, 120))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
 
 class InputButton(QPushButton):
-    """Botón de estilo personalizado para las opciones de entrada."""
+    """
+    Botón de estilo personalizado para las opciones de entrada.
+    Su estilo está en DASHBOARD_QSS (selector #InputButton).
+    """
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self.setObjectName("InputButton")
         self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         self.setMinimumWidth(120)
         self.setMinimumHeight(40)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #e84118;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                padding: 8px 20px;
-                font-size: 15px;
-                font-weight: 700;
-                height: 40px;
-                margin: 0px;
-                min-width: 120px;
-                letter-spacing: 0.02em;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: #ff5c33;
-            }
-            QPushButton[primary="true"] {
-                background-color: #e84118;
-                color: #FFFFFF;
-                font-weight: 800;
-            }
-            QPushButton[primary="true"]:hover {
-                background-color: #ff5c33;
-            }
-        """)
-
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(232, 65, 24, 150))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
 
 class VideoControls(QFrame):
     def __init__(self, parent=None):
@@ -235,58 +397,7 @@ class VideoControls(QFrame):
 
         self.setLayout(layout)
         self.setFixedHeight(40)
-        self.setStyleSheet("""
-            QFrame#VideoControls {
-                background-color: #181818;
-                border: none;
-                border-radius: 10px;
-            }
-            QPushButton {
-                background-color: transparent;
-                color: #fff;
-                border: none;
-                font-size: 22px;
-                padding: 0 2px;
-                min-width: 28px;
-                min-height: 28px;
-                border-radius: 6px;
-                transition: background 0.2s;
-            }
-            QPushButton:hover {
-                background-color: #232323;
-                color: #e84118;
-            }
-            QLabel {
-                color: #fff;
-                font-size: 15px;
-                font-weight: 600;
-                min-width: 90px;
-                qproperty-alignment: AlignCenter;
-            }
-            QSlider::groove:horizontal {
-                border: none;
-                height: 6px;
-                background: #444;
-                margin: 0 0 0 0;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #e84118;
-                border: none;
-                width: 18px;
-                height: 18px;
-                margin: -6px 0;
-                border-radius: 9px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #e84118;
-                border-radius: 3px;
-            }
-            QSlider::add-page:horizontal {
-                background: #222;
-                border-radius: 3px;
-            }
-        """)
+        self.setStyleSheet(VIDEO_CONTROLS_QSS)
     def update_play_pause_symbol(self):
         if self.play_pause_btn.isChecked():
             self.play_pause_btn.setText("⏸")
@@ -362,37 +473,701 @@ class CameraSidebar(QFrame):
         layout.addStretch(2)
         self.setLayout(layout)
 
+class VideoSurface(QOpenGLWidget):
+    """
+    Superficie de previsualización. Con OpenGL disponible cada frame se sube como
+    textura y se dibuja en la GPU; si no, se usa un QWidget normal con el mismo API.
+    Muestra el QImage de visualización del dashboard (setFrame) sin convertirlo a QPixmap.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._frame = None
+        self._message = ""
+        self._background = QColor("#1e1e1e")
+
+    def setFrame(self, image):
+        """Muestra un QImage del tamaño de la superficie (se dibuja tal cual en 0,0)."""
+        # El buffer se reescribe desde numpy: bits() cambia el cacheKey del QImage para
+        # que el motor OpenGL vuelva a subir la textura en lugar de usar la anterior.
+        image.bits()
+        self._frame = image
+        self.update()
+
+    def clear(self):
+        self._frame = None
+        self.update()
+
+    def setMessage(self, text):
+        """
+        Texto centrado de estado (p. ej. al cargar modelos o abrir un video). Si hay un
+        frame en pantalla se dibuja encima, sobre una franja oscura. "" lo quita.
+        """
+        self._message = text
+        self.update()
+
+    def _paint(self):
+        painter = QPainter(self)
+        if self._frame is not None:
+            painter.drawImage(0, 0, self._frame)
+        else:
+            painter.fillRect(self.rect(), self._background)
+        if self._message:
+            if self._frame is not None:
+                band = QRect(0, self.height() // 2 - 20, self.width(), 40)
+                painter.fillRect(band, QColor(0, 0, 0, 160))
+            painter.setPen(QColor("#CCCCCC"))
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._message)
+        painter.end()
+
+    if OPENGL_AVAILABLE:
+        def paintGL(self):
+            self._paint()
+    else:
+        def paintEvent(self, event):
+            self._paint()
+
+class AVVideoCapture:
+    """
+    Lector de archivos de video con PyAV y la misma interfaz que cv2.VideoCapture
+    (grab/retrieve/read/get/set/release). Un seek salta al keyframe anterior al frame
+    pedido y decodifica solo desde ahí, en vez de recorrer el video desde mucho antes.
+    """
+    def __init__(self, path):
+        self.container = av.open(str(path))
+        self.stream = self.container.streams.video[0]
+        self.stream.thread_type = "AUTO"
+        rate = self.stream.average_rate or self.stream.guessed_rate
+        self._fps = float(rate) if rate else 0.0
+        self._time_base = self.stream.time_base
+        self._start_pts = self.stream.start_time or 0
+        self._frame_count = self._count_frames()
+        if not self._frame_count:
+            # Sin número de frames no hay deslizador ni seeks: open_video usará OpenCV.
+            self.container.close()
+            raise ValueError("el contenedor no indica la duración del video")
+        self._keyframe_pts = self._index_keyframes()
+        self._decoder = self.container.decode(self.stream)
+        self._frame = None
+        # Frame ya decodificado durante un seek, que será el próximo en leerse.
+        self._pending = None
+        self._next_index = 0
+        self._opened = True
+
+    def isOpened(self):
+        return self._opened
+
+    def _count_frames(self):
+        """
+        Número de frames según el stream o, si no lo indica (habitual en MKV/WebM),
+        según la duración del stream o del contenedor. Retorna 0 si no hay forma de saberlo.
+        """
+        if self.stream.frames:
+            return self.stream.frames
+        if not self._fps:
+            return 0
+        if self.stream.duration:
+            return int(self.stream.duration * self._time_base * self._fps)
+        if self.container.duration:
+            return int(self.container.duration / av.time_base * self._fps)
+        return 0
+
+    def _index_keyframes(self):
+        """
+        Recorre los paquetes (sin decodificar) y guarda el PTS de cada keyframe, para
+        que cada seek vaya directo al keyframe correcto. Deja el archivo al principio.
+        """
+        pts = [packet.pts for packet in self.container.demux(self.stream)
+               if packet.is_keyframe and packet.pts is not None]
+        self.container.seek(0)
+        return np.array(sorted(pts), dtype=np.int64)
+
+    def _index_of(self, frame):
+        """Índice de frame a partir del PTS (o el siguiente esperado si no lo tiene)."""
+        if frame.pts is None or not self._fps:
+            return self._next_index
+        return int(round((frame.pts - self._start_pts) * self._time_base * self._fps))
+
+    def grab(self):
+        if self._pending is not None:
+            self._frame, self._pending = self._pending, None
+        else:
+            try:
+                self._frame = next(self._decoder)
+            except (StopIteration, av.error.FFmpegError):
+                self._frame = None
+                return False
+        self._next_index = self._index_of(self._frame) + 1
+        return True
+
+    def retrieve(self):
+        if self._frame is None:
+            return False, None
+        return True, self._frame.to_ndarray(format='bgr24')
+
+    def read(self):
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FPS:
+            return self._fps
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return self._frame_count
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return self._next_index
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return self.stream.codec_context.width
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return self.stream.codec_context.height
+        return 0
+
+    def _seek_before(self, index):
+        """Lleva el demuxer al keyframe anterior al frame `index`. Retorna el PTS de ese frame."""
+        target_pts = self._start_pts + int(max(0, int(index)) / self._fps / self._time_base)
+        seek_pts = target_pts
+        i = np.searchsorted(self._keyframe_pts, target_pts, side='right') - 1
+        if i >= 0:
+            seek_pts = int(self._keyframe_pts[i])
+        self.container.seek(seek_pts, backward=True, any_frame=False, stream=self.stream)
+        self._decoder = self.container.decode(self.stream)
+        self._pending = None
+        return target_pts
+
+    def read_keyframe(self, index):
+        """
+        Lee solo el keyframe anterior al frame `index`, sin decodificar el resto del
+        GOP. Sirve de vista previa rápida; el siguiente grab() continúa desde ahí.
+        """
+        if not self._fps:
+            return False, None
+        self._seek_before(index)
+        return self.read()
+
+    def set(self, prop, value):
+        """Solo admite CAP_PROP_POS_FRAMES: seek al keyframe anterior y avance hasta el frame."""
+        if prop != cv2.CAP_PROP_POS_FRAMES or not self._fps:
+            return False
+        target_pts = self._seek_before(value)
+        self._next_index = max(0, int(value))
+        try:
+            for frame in self._decoder:
+                if frame.pts is None or frame.pts >= target_pts:
+                    self._pending = frame
+                    break
+        except av.error.FFmpegError:
+            pass
+        return True
+
+    def release(self):
+        if self._opened:
+            self.container.close()
+            self._opened = False
+
+
+class CaptureThread(QThread):
+    """
+    Hilo productor que lee frames de un cv2.VideoCapture y ejecuta la detección fuera
+    del hilo de la GUI, que solo se encarga de mostrarlos.
+    Solo conserva el frame más reciente: si la GUI va lenta, los frames viejos se descartan.
+    """
+    frameReady = pyqtSignal()
+    streamEnded = pyqtSignal()
+    # En cámara, un grab() que vuelve en menos de esto venía del buffer del driver (frame viejo).
+    STALE_GRAB_SECONDS = 0.005
+    MAX_STALE_GRABS = 4
+    # Memoria máxima de la caché de frames usada al buscar con el video en pausa.
+    FRAME_CACHE_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, cap, fps=0, detector=None, parent=None):
+        """
+        Args:
+            cap (cv2.VideoCapture): Captura ya abierta (cámara o archivo de video), o un
+                AVVideoCapture para archivos.
+            fps (float): FPS del archivo de video para respetar el ritmo de reproducción.
+                Con 0 (cámara web) se lee tan rápido como el dispositivo entrega frames.
+            detector (EmotionDetector): Si se indica, cada frame se anota en este hilo antes
+                de publicarlo. Con archivos de video y el modelo en GPU, el hilo lee varios
+                frames por adelantado y los anota en lote.
+        """
+        super().__init__(parent)
+        self.cap = cap
+        self.detector = detector
+        self._seek_gen = 0
+        self.is_file = fps > 0
+        # Posición llevada en Python: evita consultar CAP_PROP_POS_FRAMES al demuxer en cada frame.
+        self._pos = int(cap.get(cv2.CAP_PROP_POS_FRAMES)) if self.is_file else 0
+        self._interval = 1.0 / fps if fps > 0 else 0.0
+        # Reloj de reproducción: instante y posición de referencia. Cada frame tiene un
+        # plazo absoluto, así los errores de cada espera no se acumulan.
+        self._clock_base = None
+        self._clock_pos = 0
+        # Seek pendiente: se aplica en la próxima lectura (ver seek).
+        self._seek_to = None
+        # Frames decodificados por índice (LRU), para read_frame_at.
+        self._frame_cache = OrderedDict()
+        self._frame_cache_bytes = 0
+        self._latest_mutex = QMutex()
+        self._cap_mutex = QMutex()
+        self._latest = None
+        self._running = False
+        self._paused = False
+
+    def run(self):
+        self._running = True
+        while self._running:
+            if self._paused:
+                self.msleep(10)
+                continue
+            if self.is_file and self.detector is not None and self.detector.batch_capable:
+                self._run_batch()
+                continue
+            seek_gen = self._seek_gen
+            self._catch_up()
+            ok, frame, pos = self.read_frame()
+            if not ok:
+                self._running = False
+                self.streamEnded.emit()
+                break
+            annotated = self.detector is not None
+            if annotated:
+                frame = self.detector.process_stream_frame(frame)
+                # Si hubo un seek durante la inferencia, este frame ya no corresponde.
+                if seek_gen != self._seek_gen:
+                    continue
+            self._publish(frame, pos, annotated)
+            self._wait_for(pos)
+
+    def _run_batch(self):
+        """Lee un lote de frames, los anota en una sola pasada y los publica a su ritmo."""
+        seek_gen = self._seek_gen
+        frames, positions = [], []
+        for _ in range(self.detector.batch_size):
+            ok, frame, pos = self.read_frame()
+            if not ok:
+                break
+            frames.append(frame)
+            positions.append(pos)
+        ended = len(frames) < self.detector.batch_size
+        for frame, pos in zip(self.detector.process_frame_batch(frames), positions):
+            while self._paused and self._running:
+                self.msleep(10)
+            # Un seek o stop invalida los frames que quedaban del lote.
+            if not self._running or seek_gen != self._seek_gen:
+                return
+            self._publish(frame, pos, True)
+            self._wait_for(pos)
+        if ended:
+            self._running = False
+            self.streamEnded.emit()
+
+    def _publish(self, frame, pos, annotated):
+        """
+        Deja el frame como el más reciente y avisa a la GUI. Si la GUI aún no retiró el
+        anterior, solo se reemplaza: ya hay un aviso en cola y no se acumulan eventos.
+        """
+        with QMutexLocker(self._latest_mutex):
+            notify = self._latest is None
+            self._latest = (frame, pos, annotated)
+        if notify:
+            self.frameReady.emit()
+
+    def _wait_for(self, pos):
+        """Duerme hasta el instante en que corresponde el frame siguiente a `pos`."""
+        if not self._interval:
+            return
+        if self._clock_base is None:
+            # Primer frame tras iniciar, reanudar o hacer seek: fija la referencia.
+            self._clock_base = time.perf_counter()
+            self._clock_pos = pos
+        deadline = self._clock_base + (pos + 1 - self._clock_pos) * self._interval
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            self.msleep(int(remaining * 1000))
+
+    def _catch_up(self):
+        """
+        Si la reproducción va atrasada más de un frame (decodificación o inferencia
+        lentas), avanza con grab() sin decodificar hasta el frame que toca mostrar.
+        """
+        if not self._interval or self._clock_base is None:
+            return
+        due = int((time.perf_counter() - self._clock_base) / self._interval)
+        late = due - (self._pos - self._clock_pos)
+        if late > 1:
+            with QMutexLocker(self._cap_mutex):
+                self._apply_seek()
+                for _ in range(late - 1):
+                    if not self.cap.grab():
+                        break
+                    self._pos += 1
+
+    def read_frame(self):
+        """Lee un frame de forma sincronizada. Retorna (ok, frame, posición)."""
+        with QMutexLocker(self._cap_mutex):
+            self._apply_seek()
+            if self.is_file:
+                if not self.cap.grab():
+                    return False, None, 0
+                self._pos += 1
+            elif not self._grab_fresh():
+                return False, None, 0
+            ok, frame = self.cap.retrieve()
+            pos = self._pos
+        if not ok or frame is None or frame.size == 0:
+            return False, None, 0
+        return True, frame, pos
+
+    def _grab_fresh(self):
+        """
+        Vacía los frames que la cámara acumuló mientras se hacía la inferencia: se
+        sigue llamando a grab() mientras devuelva al instante, hasta que uno tenga que
+        esperar al sensor. Así siempre se decodifica el frame más reciente.
+        """
+        for _ in range(self.MAX_STALE_GRABS + 1):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                return False
+            if time.perf_counter() - start > self.STALE_GRAB_SECONDS:
+                break
+        return True
+
+    def take_latest(self):
+        """Retira el frame más reciente (frame, posición, anotado) o None si no hay uno nuevo."""
+        with QMutexLocker(self._latest_mutex):
+            latest, self._latest = self._latest, None
+        return latest
+
+    def has_pending(self):
+        """True si hay un frame publicado que la GUI todavía no retiró."""
+        with QMutexLocker(self._latest_mutex):
+            return self._latest is not None
+
+    def read_frame_at(self, frame_pos):
+        """
+        Lee el frame `frame_pos` y deja la captura en el siguiente, como seek + read_frame.
+        Los frames leídos así se guardan en una caché LRU: ir y volver sobre la misma zona
+        del video con el deslizador no vuelve a decodificar. Retorna una copia, porque
+        quien la recibe dibuja encima.
+        """
+        frame_pos = int(frame_pos)
+        cached = self._frame_cache.get(frame_pos)
+        if cached is not None:
+            self._frame_cache.move_to_end(frame_pos)
+            self.seek(frame_pos + 1)
+            return True, cached.copy(), frame_pos + 1
+        self.seek(frame_pos)
+        ok, frame, pos = self.read_frame()
+        if ok:
+            self._cache_frame(frame_pos, frame.copy())
+        return ok, frame, pos
+
+    def skip_forward(self, frames):
+        """
+        Avanza `frames` frames con grab(), sin convertir ninguno. En videos de tasa
+        variable es exacto, a diferencia de un seek por CAP_PROP_POS_FRAMES.
+        Retorna la nueva posición.
+        """
+        with QMutexLocker(self._cap_mutex):
+            self._apply_seek()
+            for _ in range(frames):
+                if not self.cap.grab():
+                    break
+                self._pos += 1
+            self._seek_gen += 1
+            self._clock_base = None
+            pos = self._pos
+        with QMutexLocker(self._latest_mutex):
+            self._latest = None
+        return pos
+
+    def read_keyframe_near(self, frame_pos):
+        """
+        Vista previa para el arrastre del deslizador. Con AVVideoCapture lee el keyframe
+        anterior a `frame_pos` sin recorrer el GOP; con OpenCV hace la lectura exacta.
+        Deja pendiente un seek exacto a `frame_pos`.
+        """
+        if not hasattr(self.cap, 'read_keyframe'):
+            return self.read_frame_at(frame_pos)
+        with QMutexLocker(self._cap_mutex):
+            self._seek_to = None
+            ok, frame = self.cap.read_keyframe(frame_pos)
+            pos = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+        self.seek(frame_pos)
+        if not ok or frame is None:
+            return False, None, 0
+        return True, frame, pos
+
+    def _cache_frame(self, frame_pos, frame):
+        """Guarda un frame en la caché y descarta los menos usados si se pasa del límite."""
+        self._frame_cache[frame_pos] = frame
+        self._frame_cache_bytes += frame.nbytes
+        while self._frame_cache_bytes > self.FRAME_CACHE_BYTES and len(self._frame_cache) > 1:
+            _, old = self._frame_cache.popitem(last=False)
+            self._frame_cache_bytes -= old.nbytes
+
+    def _apply_seek(self):
+        """Ejecuta en la captura el seek pendiente. Se llama con _cap_mutex tomado."""
+        if self._seek_to is not None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, self._seek_to)
+            self._seek_to = None
+
+    def seek(self, frame_pos):
+        """
+        Mueve la captura a un frame específico y descarta el frame pendiente. El seek
+        real se hace en la próxima lectura: varios saltos seguidos cuestan uno solo.
+        """
+        with QMutexLocker(self._cap_mutex):
+            self._seek_to = int(frame_pos)
+            self._pos = int(frame_pos)
+            self._seek_gen += 1
+            self._clock_base = None
+        with QMutexLocker(self._latest_mutex):
+            self._latest = None
+
+    def pause(self):
+        self._paused = True
+
+    def resume(self):
+        # El tiempo en pausa no cuenta: se vuelve a fijar la referencia del reloj.
+        self._clock_base = None
+        self._paused = False
+        if not self.isRunning():
+            self.start()
+
+    def stop(self):
+        """Detiene el hilo y espera a que termine. No libera la captura."""
+        self._running = False
+        self.wait()
+
+class DetectorLoader(QThread):
+    """
+    Importa y construye el EmotionDetector (torch, DeepFace y el detector de rostros)
+    fuera del hilo de la GUI, para que la ventana aparezca sin esperar a los modelos.
+    """
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, model_type, parent=None):
+        super().__init__(parent)
+        self.model_type = model_type
+
+    def run(self):
+        try:
+            from emotion_detector import EmotionDetector
+            self.loaded.emit(EmotionDetector(model_type=self.model_type))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class ModelLoader(QThread):
+    """
+    Carga YOLOv8n-face (import de ultralytics y lectura de los pesos, que tardan
+    segundos) fuera del hilo de la GUI.
+    """
+    loaded = pyqtSignal(object, str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, use_cuda, parent=None):
+        super().__init__(parent)
+        self.use_cuda = use_cuda
+
+    def run(self):
+        try:
+            from emotion_detector import load_yolo_face_model
+            model, model_path = load_yolo_face_model(self.use_cuda)
+            self.loaded.emit(model, model_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+class ImageWorker(QThread):
+    """
+    Carga (si se indica una ruta) y procesa una imagen fija fuera del hilo de la GUI,
+    para que la ventana siga respondiendo mientras DeepFace analiza los rostros.
+    """
+    done = pyqtSignal(object, object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, detector, path=None, image=None, parent=None):
+        """
+        Args:
+            detector (EmotionDetector): Detector con el que se anota la imagen.
+            path (str): Archivo a leer con cv2.imread; se reduce a 640x480 como máximo.
+            image (np.ndarray): Imagen BGR ya cargada (se usa si no hay ruta).
+        """
+        super().__init__(parent)
+        self.detector = detector
+        self.path = path
+        self.image = image
+
+    def run(self):
+        try:
+            image = self.image
+            if self.path is not None:
+                image = cv2.imread(self.path)
+                if image is None:
+                    self.failed.emit("No se pudo cargar la imagen")
+                    return
+                h, w = image.shape[:2]
+                max_w, max_h = 640, 480
+                scale = min(max_w / w, max_h / h, 1.0)
+                if scale < 1.0:
+                    image = cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
+            self.done.emit(image, self.detector.process_frame(image.copy()))
+        except Exception as e:
+            self.failed.emit(f"Error procesando la imagen: {str(e)}")
+
+def open_video(file_path):
+    """
+    Abre un archivo de video. Con PyAV instalado se usa AVVideoCapture (seeks por
+    keyframe); si no, OpenCV pidiendo decodificación por hardware si la admite.
+    """
+    if PYAV_AVAILABLE:
+        try:
+            return AVVideoCapture(file_path)
+        except Exception as e:
+            print(f"[Dashboard] PyAV no pudo abrir el video ({e}), se usará OpenCV")
+    if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        cap = cv2.VideoCapture(file_path, cv2.CAP_FFMPEG,
+                               [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(file_path)
+
+def probe_vfr(cap, samples=30):
+    """
+    Detecta un video de tasa variable comparando los tiempos de los primeros frames.
+    Solo aplica a OpenCV: AVVideoCapture ya busca por PTS. Deja la captura al principio.
+    """
+    if not isinstance(cap, cv2.VideoCapture):
+        return False
+    stamps = []
+    for _ in range(samples):
+        if not cap.grab():
+            break
+        stamps.append(cap.get(cv2.CAP_PROP_POS_MSEC))
+    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    deltas = np.diff(stamps)
+    if len(deltas) < 2:
+        return False
+    spread = float(deltas.max() - deltas.min())
+    return spread > max(2.0, 0.25 * float(np.median(deltas)))
+
+class VideoLoader(QThread):
+    """
+    Abre un archivo de video fuera del hilo de la GUI: el sondeo del contenedor, el
+    índice de keyframes de PyAV y la detección de tasa variable pueden tardar en
+    discos lentos. Emite la captura abierta y si el video es de tasa variable.
+    """
+    loaded = pyqtSignal(object, bool)
+    failed = pyqtSignal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+
+    def run(self):
+        try:
+            cap = open_video(self.path)
+            if not cap.isOpened():
+                self.failed.emit("No se pudo cargar el video")
+                return
+            self.loaded.emit(cap, probe_vfr(cap))
+        except Exception as e:
+            self.failed.emit(f"Error cargando el video: {str(e)}")
+
 class EmotionDashboard(QWidget):
+    # Segundos mínimos entre actualizaciones del deslizador y del tiempo durante la reproducción.
+    UI_UPDATE_INTERVAL = 0.2
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Detector de Emociones")
-        self.detector = EmotionDetector(model_type="mediapipe")
+        # El detector se construye en segundo plano (ver DetectorLoader).
+        self.detector = None
         self.cap = None
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
+        # Cámara abierta que se conserva entre activaciones (ver toggle_webcam).
+        self._camera_cap = None
+        self.capture_thread = None
+        self._frame_busy = False
+        self._present = None
         self.is_webcam_active = False
         self.current_model = "mediapipe"
+        # Si YOLO se ejecuta en la GPU (botón "GPU"; solo con CUDA disponible).
+        self.use_gpu = False
         self.video_paused = False
         self.total_frames = 0
         self.current_frame = 0
         self.video_fps = 0
+        # Frames que avanzan o retroceden los botones de 5 segundos (fijado al cargar el video).
+        self._skip_frames = 150
+        # Video de tasa variable abierto con OpenCV: se adelanta con grab() (ver forward_video).
+        self._is_vfr = False
+        # Duración total ya formateada y último segundo mostrado en time_label.
+        self._total_time_str = "00:00"
+        self._shown_second = None
+        self._last_ui_update = 0.0
+        # Al arrastrar el deslizador los frames se muestran sin detección; solo se analiza
+        # el último cuando el arrastre se detiene un momento.
+        self._preview_frame = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self._annotate_preview)
+        # Al redimensionar, las imágenes fijas se reescalan con suavizado una sola vez,
+        # cuando el tamaño deja de cambiar (ver eventFilter).
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_resize)
         self.is_fullscreen = False
         self.controls_visible_before_fullscreen = True
         self.is_recording = False
         self.video_writer = None
         self.recorded_frames = []
         self.init_ui()
-        self.mediapipe_btn.setChecked(True)
+        self.model_buttons["mediapipe"].setChecked(True)
         self.last_uploaded_image = None
+        self._image_worker = None
+        self._video_loader = None
+        # Modelos YOLO ya cargados, por uso de GPU: volver a elegirlos no recarga nada.
+        self._model_cache = {}
+        self._model_loader = None
+        self._set_inputs_enabled(False)
+        self.image_label.setMessage("Cargando modelos…")
+        self._detector_loader = DetectorLoader(self.current_model, self)
+        self._detector_loader.loaded.connect(self._on_detector_loaded)
+        self._detector_loader.failed.connect(self._on_detector_failed)
+        self._detector_loader.start()
+
+    def _set_inputs_enabled(self, enabled):
+        """Habilita o deshabilita las fuentes de entrada y la selección de modelo."""
+        for btn in (self.webcam_btn, self.upload_img_btn, self.upload_video_btn,
+                    self.detection_scale_slider, *self.model_buttons.values()):
+            btn.setEnabled(enabled)
+        # El modelo INT8 solo se ofrece si se exportó (export_emotion_int8.py).
+        int8_ready = self.detector is not None and self.detector._ort_sess is not None
+        self.int8_checkbox.setEnabled(enabled and int8_ready)
+        self.gpu_btn.setEnabled(enabled and self.detector is not None and self.detector.cuda_available)
+
+    def _on_detector_loaded(self, detector):
+        self.detector = detector
+        self.current_model = detector.model_type
+        self._check_model_button(self.current_model)
+        with QSignalBlocker(self.int8_checkbox):
+            self.int8_checkbox.setChecked(detector.use_int8_emotion)
+        self.use_gpu = detector.use_cuda
+        with QSignalBlocker(self.gpu_btn):
+            self.gpu_btn.setChecked(self.use_gpu)
+        self.image_label.setMessage("")
+        self._set_inputs_enabled(True)
+
+    def _on_detector_failed(self, error):
+        self.image_label.setMessage("No se pudieron cargar los modelos")
+        QMessageBox.critical(self, "Error", f"Error cargando los modelos: {error}")
 
     def init_ui(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                color: #FFFFFF;
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            }
-        """)
+        self.setStyleSheet(DASHBOARD_QSS)
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setStyleSheet("QScrollArea { background: transparent; border: none; }")
@@ -418,25 +1193,33 @@ class EmotionDashboard(QWidget):
         face_buttons_layout.setSpacing(20)
         face_buttons_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         
-        self.haar_btn = ModelButton("Haar Cascade", "Ligero, rápido no muy preciso")
-        self.haar_btn.setProperty("model", "haar")
-        self.haar_btn.setMinimumWidth(220)
-        self.yolo_btn = ModelButton("YOLOv8n-face", "Optimizado para rostros, Lento pero preciso")
-        self.yolo_btn.setProperty("model", "yolo")
-        self.yolo_btn.setMinimumWidth(220)
-        self.mediapipe_btn = ModelButton("MediaPipe", "Moderno y robusto")
-        self.mediapipe_btn.setProperty("model", "mediapipe")
-        self.mediapipe_btn.setMinimumWidth(220)
-
-        self.haar_btn.clicked.connect(lambda: self.change_model("haar"))
-        self.yolo_btn.clicked.connect(lambda: self.change_model("yolo"))
-        self.mediapipe_btn.clicked.connect(lambda: self.change_model("mediapipe"))
-
-        face_buttons_layout.addWidget(self.haar_btn)
-        face_buttons_layout.addWidget(self.yolo_btn)
-        face_buttons_layout.addWidget(self.mediapipe_btn)
+        self.model_buttons = {}
+        for key, label, desc, _, _ in MODELS:
+            btn = ModelButton(label, desc, key)
+            btn.clicked.connect(lambda _checked, key=key: self.change_model(key))
+            face_buttons_layout.addWidget(btn)
+            self.model_buttons[key] = btn
         
         face_detector_layout.addLayout(face_buttons_layout)
+
+        # Resolución a la que se buscan rostros: menos píxeles, detección más rápida.
+        detection_scale_layout = QHBoxLayout()
+        detection_scale_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+        self.detection_scale_label = QLabel("Resolución de detección: 100%")
+        self.detection_scale_slider = QSlider(Qt.Orientation.Horizontal)
+        self.detection_scale_slider.setRange(1, 4)
+        self.detection_scale_slider.setValue(4)
+        self.detection_scale_slider.setPageStep(1)
+        self.detection_scale_slider.setFixedWidth(200)
+        self.detection_scale_slider.valueChanged.connect(self.change_detection_scale)
+        detection_scale_layout.addWidget(self.detection_scale_label)
+        detection_scale_layout.addWidget(self.detection_scale_slider)
+        face_detector_layout.addLayout(detection_scale_layout)
+
+        self.int8_checkbox = QCheckBox("Emociones con modelo cuantizado INT8 (ONNX Runtime)")
+        self.int8_checkbox.setToolTip("Requiere emotion_int8.onnx (ver export_emotion_int8.py)")
+        self.int8_checkbox.toggled.connect(self.toggle_int8_emotion)
+        face_detector_layout.addWidget(self.int8_checkbox, alignment=Qt.AlignmentFlag.AlignHCenter)
         collapsible_controls_layout.addWidget(face_detector_section)
 
         # --- Sección del Detector de Emociones (Solo visualización) ---
@@ -477,12 +1260,17 @@ class EmotionDashboard(QWidget):
         self.webcam_btn.setProperty("primary", True)
         self.upload_img_btn = InputButton("Subir Imagen")
         self.upload_video_btn = InputButton("Subir Video")
+        self.gpu_btn = InputButton("GPU")
+        self.gpu_btn.setCheckable(True)
+        self.gpu_btn.setToolTip("Ejecuta YOLO en la GPU (CUDA) con FP16")
+        self.gpu_btn.toggled.connect(self.toggle_gpu)
         self.webcam_btn.clicked.connect(self.toggle_webcam)
         self.upload_img_btn.clicked.connect(self.upload_image)
         self.upload_video_btn.clicked.connect(self.upload_video)
         input_buttons_layout.addWidget(self.webcam_btn)
         input_buttons_layout.addWidget(self.upload_video_btn)
         input_buttons_layout.addWidget(self.upload_img_btn)
+        input_buttons_layout.addWidget(self.gpu_btn)
         input_layout.addLayout(input_buttons_layout)
         collapsible_controls_layout.addWidget(input_section)
 
@@ -514,12 +1302,24 @@ class EmotionDashboard(QWidget):
         preview_layout = QVBoxLayout(self.preview_frame)
         preview_layout.setSpacing(5)
         preview_layout.setContentsMargins(5, 5, 5, 5)
-        self.image_label = QLabel()
+        self.image_label = VideoSurface()
         self.image_label.setObjectName("PreviewImage")
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setMinimumSize(800, 600)
         self.image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.image_label.setScaledContents(False)  # Mantener aspecto
+        self.image_label.installEventFilter(self)
+        # Cada paintEvent cubre la superficie completa (frame o fondo): Qt no necesita rellenarla.
+        self.image_label.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.image_label.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        # Tamaño del label, actualizado solo cuando el label cambia de tamaño.
+        self._label_size = (800, 600)
+        # QImage persistente del tamaño del label y la vista numpy de la zona donde va el
+        # frame (ver _display). Las franjas alrededor se pintan una sola vez.
+        self._display_img = None
+        self._display_view = None
+        self._display_src_shape = None
+        # Último frame mostrado (cámara, video o imagen), para redibujarlo al redimensionar.
+        self._last_frame = None
+        self._last_smooth = False
         preview_layout.addWidget(self.image_label, 1)  # Stretch factor 1 para expandir
         
         # Añade los controles de video con el nuevo diseño.
@@ -532,7 +1332,11 @@ class EmotionDashboard(QWidget):
         self.video_controls.rewind_btn.clicked.connect(self.rewind_video)
         self.video_controls.forward_btn.clicked.connect(self.forward_video)
         self.video_controls.stop_btn.clicked.connect(self.stop_video)
-        self.video_controls.progress_slider.sliderMoved.connect(self.seek_video)
+        # Mientras se arrastra solo se muestran keyframes (búsqueda continua); al soltar
+        # se hace un único seek exacto.
+        self.video_controls.progress_slider.sliderPressed.connect(self._on_slider_pressed)
+        self.video_controls.progress_slider.sliderMoved.connect(self.preview_seek)
+        self.video_controls.progress_slider.sliderReleased.connect(self._on_slider_released)
         self.video_controls.fullscreen_btn.clicked.connect(self.toggle_fullscreen)
         
         self.record_btn = QPushButton("⏺️ Grabar")
@@ -560,10 +1364,9 @@ class EmotionDashboard(QWidget):
         self.setLayout(main_layout)
         self.setMinimumSize(1200, 800)  # Tamaño mínimo más grande
 
-        # --- Animación para los controles superiores ---
-        self.animation = QPropertyAnimation(self.collapsible_controls_frame, b"maximumHeight")
-        self.animation.setDuration(300)
-        self.animation.setEasingCurve(QEasingCurve.Type.InOutQuart)
+        # --- Animación para los controles superiores (ver toggle_top_controls) ---
+        self.animation = None
+        self._controls_fading_out = False
         self.camera_sidebar = CameraSidebar(self.image_label)
         self.camera_sidebar.setMinimumHeight(220)
         self.camera_sidebar.setFixedWidth(110)
@@ -582,31 +1385,40 @@ class EmotionDashboard(QWidget):
         self.record_timer.timeout.connect(self.update_record_time)
 
     def toggle_top_controls(self):
-        start_height = self.collapsible_controls_frame.height()
-        end_height = 0
-        
-        if not self.collapsible_controls_frame.isVisible():
-            self.collapsible_controls_frame.setVisible(True)
-            end_height = self.collapsible_controls_frame.sizeHint().height()
-            self.toggle_button.setText("Ocultar Controles ▲")
-        else:
-            self.toggle_button.setText("Mostrar Controles ▼")
-
-        self.animation.setStartValue(start_height)
-        self.animation.setEndValue(end_height)
-        
-        # Oculta el frame cuando la animación de colapso termina.
-        if end_height == 0:
-            self.animation.finished.connect(lambda: self.collapsible_controls_frame.setVisible(False))
+        """
+        Muestra u oculta los controles con un fundido de opacidad. El layout cambia una
+        sola vez (al mostrar o al ocultar el frame), no en cada paso de la animación.
+        """
+        frame = self.collapsible_controls_frame
+        showing = not frame.isVisible() or self._controls_fading_out
+        if self.animation is not None:
+            self.animation.stop()
+        self.toggle_button.setText("Ocultar Controles ▲" if showing else "Mostrar Controles ▼")
+
+        effect = QGraphicsOpacityEffect(frame)
+        frame.setGraphicsEffect(effect)
+        self.animation = QPropertyAnimation(effect, b"opacity", self)
+        self.animation.setDuration(300)
+        self.animation.setEasingCurve(QEasingCurve.Type.InOutQuart)
+        if showing:
+            frame.setVisible(True)
+            self.animation.setStartValue(0.0)
+            self.animation.setEndValue(1.0)
         else:
-            # Desconecta la señal para evitar que se oculte al expandir.
-            try:
-                self.animation.finished.disconnect()
-            except (TypeError, RuntimeError):
-                pass
-
+            self.animation.setStartValue(1.0)
+            self.animation.setEndValue(0.0)
+        self._controls_fading_out = not showing
+        self.animation.finished.connect(lambda: self._finish_controls_fade(showing))
         self.animation.start()
 
+    def _finish_controls_fade(self, shown):
+        """Oculta el frame si se estaba cerrando y le quita el efecto de opacidad."""
+        self._controls_fading_out = False
+        if not shown:
+            self.collapsible_controls_frame.setVisible(False)
+        # Sin el efecto, el frame vuelve al pintado normal (sin capa intermedia).
+        self.collapsible_controls_frame.setGraphicsEffect(None)
+
     def toggle_fullscreen(self):
         """Activa o desactiva el modo de pantalla completa."""
         if self.is_fullscreen:
@@ -638,65 +1450,180 @@ class EmotionDashboard(QWidget):
 
     def _stop_current_media(self):
         """Detiene cualquier fuente de medios activa (cámara web o video)."""
+        # Un video que aún se está abriendo se descarta al llegar (ver _on_video_loaded).
+        if self._video_loader is not None:
+            self._video_loader = None
+            self.image_label.setMessage("")
         if self.is_webcam_active:
-            self.timer.stop()
-            if self.cap:
-                self.cap.release()
-                self.cap = None
+            # La cámara queda abierta para reanudarla sin volver a inicializar el dispositivo.
+            self._stop_capture(release=False)
             self.is_webcam_active = False
             self.webcam_btn.setText("Activar Cámara")
-            self.image_label.clear()
+            self._clear_display()
             self.video_controls.setVisible(False)
             self.video_controls.time_label.setText("00:00 / 00:00")
-        elif self.timer.isActive():
-            self.timer.stop()
-            if self.cap:
-                self.cap.release()
-                self.cap = None
+        elif self.capture_thread is not None:
+            self._stop_capture()
             self.video_controls.setVisible(False)
 
+    def _start_capture(self, fps=0):
+        """Lanza el hilo de captura sobre self.cap y conecta sus señales."""
+        self.detector.reset_stream()
+        self.capture_thread = CaptureThread(self.cap, fps, detector=self.detector)
+        # El modo se resuelve una vez aquí: cada frame va directo a la rutina de su fuente.
+        self._present = self._present_video if fps > 0 else self._present_webcam
+        # Conexiones en cola explícitas: los slots siempre corren en el hilo de la GUI.
+        self.capture_thread.frameReady.connect(self.update_frame, Qt.ConnectionType.QueuedConnection)
+        self.capture_thread.streamEnded.connect(self._on_stream_ended, Qt.ConnectionType.QueuedConnection)
+        self.capture_thread.start()
+
+    def _stop_capture(self, release=True):
+        """
+        Detiene el hilo de captura y libera la captura. Con release=False la captura
+        sigue abierta (se usa con la cámara, que queda guardada en self._camera_cap).
+        """
+        if self.capture_thread is not None:
+            self.capture_thread.stop()
+            self.capture_thread = None
+        if self.cap and release:
+            self.cap.release()
+            if self.cap is self._camera_cap:
+                self._camera_cap = None
+        self.cap = None
+
+    def _release_camera(self):
+        """Cierra la cámara que se mantenía abierta entre sesiones."""
+        if self._camera_cap is not None:
+            self._camera_cap.release()
+            self._camera_cap = None
+
+    def _open_camera(self, index):
+        """
+        Abre la cámara con el backend nativo del sistema (DirectShow en Windows, V4L2 en
+        Linux), que entrega los frames con menos buffering que el backend por defecto.
+        """
+        if sys.platform.startswith("win"):
+            cap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+        elif sys.platform.startswith("linux"):
+            cap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        else:
+            cap = cv2.VideoCapture(index)
+        if not cap.isOpened():
+            cap.release()
+            cap = cv2.VideoCapture(index)
+        # Un solo hilo de decodificación evita un frame de retraso por hilo (MJPG).
+        if hasattr(cv2, "CAP_PROP_N_THREADS"):
+            cap.set(cv2.CAP_PROP_N_THREADS, 1)
+        return cap
+
+    def _set_capture_buffer(self, cap):
+        """
+        Limita el buffer interno de la cámara a un solo frame. Solo aplica a cámaras:
+        los archivos de video no tienen ese buffer y el backend no admite la propiedad.
+        """
+        if not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+            print("[Dashboard] El backend de captura no admite CAP_PROP_BUFFERSIZE")
+
+    def _check_model_button(self, model_name):
+        """Marca solo el botón del modelo activo; los colores los resuelve la hoja de estilo."""
+        for key, btn in self.model_buttons.items():
+            btn.setChecked(key == model_name)
+
+    def change_detection_scale(self, value):
+        """Fija la fracción de resolución (25%-100%) con la que el detector busca rostros."""
+        self.detection_scale_label.setText(f"Resolución de detección: {value * 25}%")
+        with self.detector.lock:
+            self.detector.detection_scale = value / 4
+            self.detector.reset_stream()
+
+    def toggle_int8_emotion(self, checked):
+        """Alterna el análisis de emociones entre DeepFace y el modelo INT8."""
+        with self.detector.lock:
+            self.detector.use_int8_emotion = checked
+            self.detector.reset_stream()
+        if self.last_uploaded_image is not None and self.capture_thread is None:
+            self._process_still(image=self.last_uploaded_image)
+
+    def toggle_gpu(self, checked):
+        """
+        Activa o desactiva la GPU. Solo YOLO usa la GPU, así que únicamente entonces se
+        recarga el modelo; el detector no cambia de dispositivo hasta que el nuevo lo reemplaza.
+        """
+        self.use_gpu = checked
+        if self.current_model == "yolo":
+            self.change_model(self.current_model)
+
     def change_model(self, model_name):
         """Cambia el modelo de detección de rostros."""
         if model_name == "yolo":
-            try:
-                from ultralytics import YOLO
-                current_dir = Path(__file__).parent
-                model_path = str(current_dir / 'yolov8n-face.pt')
-                print(f"[Dashboard] Buscando modelo YOLOv8n-face en: {model_path}")
-                if not Path(model_path).exists():
+            # El ajuste de GPU solo se aplica al detector junto con el modelo nuevo
+            # (_apply_yolo_model); el modelo actual sigue con el suyo mientras se carga.
+            use_cuda = self.use_gpu and self.detector.cuda_available
+            cached = self._model_cache.get(use_cuda)
+            if cached is None:
+                # La carga sigue en ModelLoader; el modelo se asigna en _on_yolo_loaded.
+                if not (Path(__file__).parent / 'yolov8n-face.pt').exists():
                     print("[Dashboard] Modelo yolov8n-face.pt no encontrado, se intentará descargar...")
-                self.detector.detector = YOLO(model_path)
-                self.detector.model_type = "yolo"
-                self.current_model = "yolo"
-                self.haar_btn.setChecked(False)
-                self.yolo_btn.setChecked(True)
-                self.mediapipe_btn.setChecked(False)
-                print(f"YOLOv8n-face modelo carga exitoso {model_path}")
-            except Exception as e:
-                error_msg = f"No se pudo cargar yolov8n-face.pt: {str(e)}"
-                print(error_msg)
-                QMessageBox.critical(self, "Error", error_msg)
-                self.change_model("haar")
+                for btn in self.model_buttons.values():
+                    btn.setEnabled(False)
+                self.gpu_btn.setEnabled(False)
+                if self._model_loader is None:
+                    QApplication.setOverrideCursor(Qt.CursorShape.BusyCursor)
+                loader = ModelLoader(use_cuda, parent=self)
+                loader.loaded.connect(self._on_yolo_loaded)
+                loader.failed.connect(self._on_yolo_failed)
+                loader.finished.connect(loader.deleteLater)
+                self._model_loader = loader
+                loader.start()
+                return
+            self._apply_yolo_model(*cached, use_cuda)
         else:
-            if self.detector.change_model(model_name):
+            if self.detector.change_model(model_name, use_gpu=self.use_gpu):
                 self.current_model = model_name
-                self.haar_btn.setChecked(model_name == "haar")
-                self.yolo_btn.setChecked(model_name == "yolo")
-                self.mediapipe_btn.setChecked(model_name == "mediapipe")
+                self._check_model_button(model_name)
             else:
                 QMessageBox.warning(self, "Error", f"Modelo desconocido: {model_name}")
         # Al final de la función, reprocesa la última imagen si existe
-        if hasattr(self, 'last_uploaded_image') and self.last_uploaded_image is not None:
-            try:
-                processed = self.detector.process_frame(self.last_uploaded_image.copy())
-                processed = cv2.cvtColor(processed, cv2.COLOR_BGR2RGB)
-                h, w, ch = processed.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(processed.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                scaled_pixmap = self.scale_image_to_label(qt_image)
-                self.image_label.setPixmap(scaled_pixmap)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error reprocesando la imagen: {str(e)}")
+        if self.last_uploaded_image is not None and self.capture_thread is None:
+            self._process_still(image=self.last_uploaded_image)
+
+    def _apply_yolo_model(self, model, model_path, use_cuda):
+        """Cambia el modelo y su ajuste de GPU a la vez, bajo el lock del detector."""
+        with self.detector.lock:
+            self.detector.detector = model
+            self.detector.use_cuda = use_cuda
+            self.detector.model_type = "yolo"
+            self.detector.reset_stream()
+        self.current_model = "yolo"
+        self._check_model_button("yolo")
+        print(f"YOLOv8n-face modelo carga exitoso {model_path}")
+
+    def _finish_model_load(self):
+        """Devuelve la interfaz al estado normal tras cargar (o no) un modelo."""
+        self._model_loader = None
+        QApplication.restoreOverrideCursor()
+        for btn in self.model_buttons.values():
+            btn.setEnabled(True)
+        self.gpu_btn.setEnabled(self.detector.cuda_available)
+
+    def _on_yolo_loaded(self, model, model_path):
+        loader = self.sender()
+        if loader is not self._model_loader:
+            return
+        self._finish_model_load()
+        self._model_cache[loader.use_cuda] = (model, model_path)
+        self._apply_yolo_model(model, model_path, loader.use_cuda)
+        if self.last_uploaded_image is not None and self.capture_thread is None:
+            self._process_still(image=self.last_uploaded_image)
+
+    def _on_yolo_failed(self, error):
+        if self.sender() is not self._model_loader:
+            return
+        self._finish_model_load()
+        error_msg = f"No se pudo cargar yolov8n-face.pt: {error}"
+        print(error_msg)
+        QMessageBox.critical(self, "Error", error_msg)
+        self.change_model("haar")
 
     def toggle_webcam(self):
         if self.is_webcam_active:
@@ -705,15 +1632,30 @@ class EmotionDashboard(QWidget):
         else:
             self._stop_current_media()
             try:
-                self.cap = cv2.VideoCapture(0)
-                if not self.cap.isOpened():
-                    QMessageBox.warning(self, "Error", "No se pudo acceder a la cámara")
-                    return
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                if self._camera_cap is not None and self._camera_cap.isOpened():
+                    # Reutiliza la cámara ya configurada; los frames viejos se descartan al leer.
+                    self.cap = self._camera_cap
+                else:
+                    self.cap = self._open_camera(0)
+                    if not self.cap.isOpened():
+                        QMessageBox.warning(self, "Error", "No se pudo acceder a la cámara")
+                        return
+                    # Evita que el driver acumule frames viejos (latencia creciente).
+                    self._set_capture_buffer(self.cap)
+                    # MJPG: la cámara entrega frames comprimidos y se decodifican en el host.
+                    self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+                    self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+                    self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                    # La detección no necesita más de 15 FPS; menos frames por segundo que mover.
+                    self.cap.set(cv2.CAP_PROP_FPS, 15)
+                    print(f"[Dashboard] Cámara negociada: "
+                          f"{int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))}x"
+                          f"{int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))} @ "
+                          f"{self.cap.get(cv2.CAP_PROP_FPS):.0f} FPS")
+                    self._camera_cap = self.cap
                 self.is_webcam_active = True
                 self.webcam_btn.setText("Detener Cámara")
-                self.timer.start(30)
+                self._start_capture()
                 self.video_controls.setVisible(False)
                 self.camera_sidebar.show()
                 self.position_camera_sidebar()
@@ -723,56 +1665,166 @@ class EmotionDashboard(QWidget):
                 if self.cap:
                     self.cap.release()
                     self.cap = None
+                self._camera_cap = None
 
     def update_frame(self):
-        """Se ejecuta con cada tick del QTimer para procesar y mostrar un nuevo frame."""
-        if self.video_paused and not self.is_webcam_active:
+        """Se ejecuta cuando el hilo de captura publica un frame nuevo."""
+        # Evita reentrar si un diálogo abre un bucle de eventos anidado mientras se procesa.
+        if self.capture_thread is None or self._frame_busy:
             return
-        if not self.cap or not self.cap.isOpened():
-            self.timer.stop()
+        latest = self.capture_thread.take_latest()
+        if latest is None:
             return
-        ret, frame = self.cap.read()
-        if not ret:
-            self.timer.stop()
-            if self.is_webcam_active:
-                self.toggle_webcam()
-            else: # Fin del archivo de video
-                self.stop_video()
+        self._frame_busy = True
+        try:
+            self._present(*latest)
+        finally:
+            self._frame_busy = False
+        # Si llegó un frame mientras se procesaba y su aviso se descartó, se atiende ahora.
+        if self.capture_thread is not None and self.capture_thread.has_pending():
+            QTimer.singleShot(0, self.update_frame)
+
+    def _on_stream_ended(self):
+        """La cámara dejó de entregar frames o el video llegó al final."""
+        if self.is_webcam_active:
+            self.toggle_webcam()
+            # La cámara dejó de responder: no debe reutilizarse en el próximo arranque.
+            self._release_camera()
+        else: # Fin del archivo de video
+            self.stop_video()
+
+    def _present_webcam(self, frame, pos, annotated=False):
+        """
+        Muestra un frame de la cámara (y lo guarda si se está grabando). Si `annotated`
+        es False la detección se ejecuta aquí en lugar de en el hilo de captura.
+        """
+        if not annotated:
+            # process_stream_frame ya reescala a 640x480 (con OpenCL si está disponible).
+            frame = self.detector.process_stream_frame(frame)
+        if self.is_recording:
+            # Cada frame publicado es un array nuevo que nadie vuelve a escribir: no hace falta copiarlo.
+            self.recorded_frames.append(frame)
+        try:
+            self._display(frame)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error procesando frame: {str(e)}")
+
+    def _present_video(self, frame, pos, annotated=False, run_detector=True):
+        """
+        Muestra un frame de un archivo de video y actualiza el deslizador y el tiempo.
+        Si `annotated` es False (p. ej. un frame suelto con el video en pausa) la
+        detección se ejecuta aquí, salvo con `run_detector=False`.
+        """
+        if not annotated and run_detector:
+            frame = self.detector.process_stream_frame(frame)
+        try:
+            self._display(frame)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error procesando frame: {str(e)}")
             return
-        # Asegura que el frame no esté vacío.
-        if frame is None or frame.size == 0:
+        self.current_frame = pos
+        # El deslizador y el tiempo se refrescan a unos 5 Hz, no en cada frame.
+        now = time.monotonic()
+        if now - self._last_ui_update < self.UI_UPDATE_INTERVAL:
             return
-        h, w = frame.shape[:2]
-        max_w, max_h = 640, 480
-        scale = min(max_w / w, max_h / h, 1.0)
-        if scale < 1.0:
-            frame = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-        processed_frame = self.detector.process_frame(frame)
-        if self.is_webcam_active and self.is_recording:
-            self.recorded_frames.append(processed_frame.copy())
+        self._last_ui_update = now
         try:
-            frame_rgb = cv2.cvtColor(processed_frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-            scaled_pixmap = self.scale_image_to_label(qt_image)
-            self.image_label.setPixmap(scaled_pixmap)
+            self._set_slider_value(int(pos))
+            # El texto solo cambia una vez por segundo; se evita rehacerlo en cada frame.
+            current_sec = int(pos / self.video_fps)
+            if current_sec != self._shown_second:
+                self._shown_second = current_sec
+                self.video_controls.time_label.setText(
+                    f"{format_time(current_sec)} / {self._total_time_str}"
+                )
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error procesando frame: {str(e)}")
+            pass
+
+    def _display(self, frame, smooth=False):
+        """
+        Único punto de salida a pantalla para cámara, video e imágenes fijas. El frame
+        BGR se escala dentro del QImage persistente del tamaño del label (reservado una
+        vez y reutilizado), que luego dibuja la superficie de previsualización.
+        Con `smooth` (imágenes fijas) se usa INTER_AREA/INTER_LINEAR; en vivo, vecino
+        más cercano.
+        """
+        self._last_frame = frame
+        self._last_smooth = smooth
+        shape = frame.shape
+        if self._display_img is None or self._display_src_shape != shape[:2]:
+            self._allocate_display_image(shape[1], shape[0])
+        view = self._display_view
+        # Se redimensiona directamente dentro del buffer del QImage, sin reservar memoria nueva.
+        # Qt lee el buffer BGR de OpenCV tal cual; no hace falta convertir a RGB.
+        # En vivo basta con vecino más cercano (como el kernel numba); el suavizado queda
+        # para las imágenes fijas, que se escalan una sola vez.
+        if smooth:
+            interpolation = cv2.INTER_AREA if view.shape[1] < shape[1] else cv2.INTER_LINEAR
+            cv2.resize(frame, (view.shape[1], view.shape[0]), dst=view, interpolation=interpolation)
+        elif NUMBA_AVAILABLE:
+            bgr_to_display(frame, view)
+        else:
+            cv2.resize(frame, (view.shape[1], view.shape[0]), dst=view, interpolation=cv2.INTER_NEAREST)
+        # La superficie dibuja el QImage directamente (textura OpenGL), sin pasar por QPixmap.
+        self.image_label.setFrame(self._display_img)
+
+    def _clear_display(self):
+        """Deja la previsualización vacía y olvida el último frame mostrado."""
+        self._last_frame = None
+        self.image_label.clear()
+
+    def _allocate_display_image(self, src_w, src_h):
+        """
+        Crea el QImage persistente del tamaño del label, pinta el fondo y deja en
+        self._display_view una vista numpy sobre la zona centrada donde cabe el frame.
+        """
+        label_w, label_h = self._label_size
+        self._display_img = QImage(label_w, label_h, QImage.Format.Format_BGR888)
+        self._display_img.fill(QColor("#1e1e1e"))
+        self._display_src_shape = (src_h, src_w)
+        ptr = self._display_img.bits()
+        ptr.setsize(self._display_img.sizeInBytes())
+        # Las filas del QImage están alineadas a 4 bytes, por eso se usa bytesPerLine como stride.
+        full_view = np.ndarray(
+            (label_h, label_w, 3), dtype=np.uint8, buffer=ptr,
+            strides=(self._display_img.bytesPerLine(), 3, 1)
+        )
+        margin = 10
+        scale = min(max(1, label_w - margin) / src_w, max(1, label_h - margin) / src_h)
+        w, h = max(1, int(src_w * scale)), max(1, int(src_h * scale))
+        left, top = (label_w - w) // 2, (label_h - h) // 2
+        self._display_view = full_view[top:top + h, left:left + w]
+
+    def _set_slider_value(self, value):
+        """Mueve el deslizador sin emitir señales, para que nunca dispare un seek."""
+        slider = self.video_controls.progress_slider
+        # No se mueve el deslizador mientras el usuario lo arrastra.
+        if slider.isSliderDown():
             return
-        if self.cap and self.total_frames > 0 and not self.is_webcam_active:
-            try:
-                self.current_frame = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-                progress = int((self.current_frame / self.total_frames) * 100) if self.total_frames > 0 else 0
-                self.video_controls.progress_slider.setValue(progress)
-                if self.video_fps > 0:
-                    current_sec = self.current_frame / self.video_fps
-                    total_sec = self.total_frames / self.video_fps
-                    current_time_str = f"{int(current_sec // 60):02}:{int(current_sec % 60):02}"
-                    total_time_str = f"{int(total_sec // 60):02}:{int(total_sec % 60):02}"
-                    self.video_controls.time_label.setText(f"{current_time_str} / {total_time_str}")
-            except Exception as e:
-                pass
+        with QSignalBlocker(slider):
+            slider.setValue(value)
+
+    def _show_frame_at(self, frame_pos, skip_frames=0):
+        """
+        Posiciona el video y, si está en pausa, muestra el frame de inmediato.
+        Con `skip_frames` se avanza esa cantidad de frames con grab() en lugar de
+        hacer un seek a `frame_pos`.
+        """
+        if skip_frames:
+            frame_pos = self.capture_thread.skip_forward(skip_frames)
+        else:
+            self.capture_thread.seek(frame_pos)
+        self.current_frame = frame_pos
+        self.detector.reset_stream()
+        # Tras un salto los controles deben reflejar la nueva posición sin esperar.
+        self._last_ui_update = 0.0
+        if self.video_paused:
+            if skip_frames:
+                ret, frame, pos = self.capture_thread.read_frame()
+            else:
+                ret, frame, pos = self.capture_thread.read_frame_at(frame_pos)
+            if ret:
+                self._present_video(frame, pos)
 
     def upload_image(self):
         self._stop_current_media()
@@ -784,26 +1836,33 @@ class EmotionDashboard(QWidget):
             "Archivos de Imagen (*.png *.jpg *.jpeg *.bmp)"
         )
         if file_path:
-            try:
-                image = cv2.imread(file_path)
-                if image is None:
-                    QMessageBox.warning(self, "Error", "No se pudo cargar la imagen")
-                    return
-                h, w = image.shape[:2]
-                max_w, max_h = 640, 480
-                scale = min(max_w / w, max_h / h, 1.0)
-                if scale < 1.0:
-                    image = cv2.resize(image, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-                self.last_uploaded_image = image.copy()
-                processed = self.detector.process_frame(image)
-                processed = cv2.cvtColor(processed, cv2.COLOR_BGR2RGB)
-                h, w, ch = processed.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(processed.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                scaled_pixmap = self.scale_image_to_label(qt_image)
-                self.image_label.setPixmap(scaled_pixmap)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error procesando la imagen: {str(e)}")
+            self._process_still(path=file_path)
+
+    def _process_still(self, path=None, image=None):
+        """Lanza un ImageWorker; solo el resultado del último lanzado llega a mostrarse."""
+        worker = ImageWorker(self.detector, path=path, image=image, parent=self)
+        worker.done.connect(self._on_still_ready)
+        worker.failed.connect(self._on_still_failed)
+        worker.finished.connect(worker.deleteLater)
+        self._image_worker = worker
+        self.image_label.setMessage("Procesando imagen…")
+        worker.start()
+
+    def _on_still_ready(self, image, processed):
+        # Descarta resultados de trabajos reemplazados o si ya empezó la cámara o un video.
+        if self.sender() is not self._image_worker:
+            return
+        self.image_label.setMessage("")
+        if self.capture_thread is not None:
+            return
+        self.last_uploaded_image = image
+        self._display(processed, smooth=True)
+
+    def _on_still_failed(self, error):
+        if self.sender() is not self._image_worker:
+            return
+        self.image_label.setMessage("")
+        QMessageBox.warning(self, "Error", error)
 
     def upload_video(self):
         self._stop_current_media()
@@ -815,115 +1874,160 @@ class EmotionDashboard(QWidget):
             "Archivos de Video (*.mp4 *.avi *.mov *.mkv)"
         )
         if file_path:
-            try:
-                self.is_webcam_active = False
-                self.cap = cv2.VideoCapture(file_path)
-                if not self.cap.isOpened():
-                    QMessageBox.warning(self, "Error", "No se pudo cargar el video")
-                    return
-                self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
-                self.video_fps = self.cap.get(cv2.CAP_PROP_FPS)
-                if self.total_frames <= 0:
-                    QMessageBox.warning(self, "Error", "El archivo de video parece estar corrupto")
-                    self.cap.release()
-                    self.cap = None
-                    return
-                if self.video_fps <= 0:
-                    self.video_fps = 30
-                self.current_frame = 0
-                self.video_controls.progress_slider.setValue(0)
-                self.webcam_btn.setText("Activar Cámara")
-                self.video_controls.setVisible(True)
-                self.video_paused = False
-                self.video_controls.play_pause_btn.setChecked(True)
-                self.video_controls.update_play_pause_symbol()
-                self.timer.start(int(1000 / self.video_fps))
-                self.camera_sidebar.hide()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error cargando el video: {str(e)}")
-                if self.cap:
-                    self.cap.release()
-                    self.cap = None
+            self.is_webcam_active = False
+            self.image_label.setMessage("Abriendo video…")
+            loader = VideoLoader(file_path, parent=self)
+            loader.loaded.connect(self._on_video_loaded)
+            loader.failed.connect(self._on_video_failed)
+            loader.finished.connect(loader.deleteLater)
+            self._video_loader = loader
+            loader.start()
+
+    def _on_video_loaded(self, cap, is_vfr):
+        """Recibe la captura abierta por VideoLoader y empieza la reproducción."""
+        if self.sender() is not self._video_loader:
+            # Se eligió otro video o se activó la cámara mientras se abría este.
+            cap.release()
+            return
+        self._video_loader = None
+        self.image_label.setMessage("")
+        try:
+            self.cap = cap
+            self.total_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            self.video_fps = self.cap.get(cv2.CAP_PROP_FPS)
+            if self.total_frames <= 0:
+                QMessageBox.warning(self, "Error", "El archivo de video parece estar corrupto")
+                self.cap.release()
+                self.cap = None
+                return
+            if self.video_fps <= 0:
+                self.video_fps = 30
+            self._skip_frames = int(round(5 * self.video_fps))
+            self._is_vfr = is_vfr
+            self._total_time_str = format_time(int(self.total_frames / self.video_fps))
+            self._shown_second = None
+            self.current_frame = 0
+            # El deslizador trabaja directamente con índices de frame.
+            self.video_controls.progress_slider.setRange(0, self.total_frames - 1)
+            self._set_slider_value(0)
+            self.webcam_btn.setText("Activar Cámara")
+            self.video_controls.setVisible(True)
+            self.video_paused = False
+            self.video_controls.play_pause_btn.setChecked(True)
+            self.video_controls.update_play_pause_symbol()
+            self._start_capture(self.video_fps)
+            self.camera_sidebar.hide()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error cargando el video: {str(e)}")
+            if self.cap:
+                self.cap.release()
+                self.cap = None
+
+    def _on_video_failed(self, error):
+        if self.sender() is not self._video_loader:
+            return
+        self._video_loader = None
+        self.image_label.setMessage("")
+        QMessageBox.warning(self, "Error", error)
 
     def toggle_play_pause(self):
         """Pausa o reanuda la reproducción del video."""
-        if not self.is_webcam_active and self.cap:
+        if not self.is_webcam_active and self.capture_thread is not None:
             if self.video_paused:
-                self.timer.start(int(1000 / self.video_fps) if self.video_fps > 0 else 30)
+                self.capture_thread.resume()
                 self.video_paused = False
             else:
-                self.timer.stop()
+                self.capture_thread.pause()
                 self.video_paused = True
             self.video_controls.update_play_pause_symbol()
 
     def stop_video(self):
         """Detiene el video y lo reinicia al principio."""
-        self.timer.stop()
-        if self.cap and self.total_frames > 0:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        if self.capture_thread is not None and self.total_frames > 0:
+            self.capture_thread.stop()
             self.current_frame = 0
-            self.video_controls.progress_slider.setValue(0)
+            self._set_slider_value(0)
             self.video_paused = True
             self.video_controls.play_pause_btn.setChecked(False)
             self.video_controls.update_play_pause_symbol()
-            # Muestra el primer frame.
-            ret, frame = self.cap.read()
-            if ret and frame is not None and frame.size > 0:
-                frame = self.detector.process_frame(frame)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame.shape
-                bytes_per_line = ch * w
-                qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-                scaled_pixmap = self.scale_image_to_label(qt_image)
-                self.image_label.setPixmap(scaled_pixmap)
-            # Resetea la posición después de mostrar el primer frame
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-
+            # Muestra el primer frame. La captura queda en el siguiente, así que al
+            # reanudar la reproducción continúa desde ahí sin otro seek.
+            ret, frame, pos = self.capture_thread.read_frame_at(0)
+            if ret:
+                self.current_frame = pos
+                self._display(self.detector.process_frame(frame))
 
     def rewind_video(self):
         """Retrocede el video 5 segundos."""
-        if self.cap and self.total_frames > 0:
-            fps = self.video_fps if self.video_fps > 0 else 30
-            current = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-            new_pos = max(0, current - (5 * fps))
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, new_pos)
-            self.update_frame()
+        if self.capture_thread is not None and self.total_frames > 0:
+            new_pos = max(0, self.current_frame - self._skip_frames)
+            self._show_frame_at(new_pos)
 
     def forward_video(self):
         """Adelanta el video 5 segundos."""
-        if self.cap and self.total_frames > 0:
-            fps = self.video_fps if self.video_fps > 0 else 30
-            current = self.cap.get(cv2.CAP_PROP_POS_FRAMES)
-            new_pos = min(self.total_frames - 1, current + (5 * fps))
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, new_pos)
-            self.update_frame()
+        if self.capture_thread is not None and self.total_frames > 0:
+            new_pos = min(self.total_frames - 1, self.current_frame + self._skip_frames)
+            if self._is_vfr:
+                # En tasa variable el seek por índice cae en otro frame; grab() es exacto.
+                self._show_frame_at(new_pos, skip_frames=new_pos - self.current_frame)
+            else:
+                self._show_frame_at(new_pos)
+
+    def _on_slider_pressed(self):
+        """Pausa la lectura mientras se arrastra el deslizador."""
+        if self.capture_thread is not None and not self.video_paused:
+            self.capture_thread.pause()
+
+    def preview_seek(self, value):
+        """Durante el arrastre muestra el keyframe más cercano a la posición del deslizador."""
+        if self.capture_thread is not None and self.total_frames > 0:
+            ret, frame, pos = self.capture_thread.read_keyframe_near(value)
+            if ret:
+                self._present_video(frame, pos, run_detector=False)
+                self._preview_frame = (frame, pos)
+                self._preview_timer.start()
+
+    def _annotate_preview(self):
+        """Ejecuta la detección sobre el frame de vista previa en el que se detuvo el arrastre."""
+        if self._preview_frame is None or self.capture_thread is None:
+            return
+        frame, pos = self._preview_frame
+        self._preview_frame = None
+        self.detector.reset_stream()
+        self._present_video(frame, pos)
+
+    def _on_slider_released(self):
+        """Al soltar el deslizador, seek exacto a la posición final y reanuda si se reproducía."""
+        # La posición se toma del deslizador al soltarlo, no del último keyframe mostrado.
+        value = self.video_controls.progress_slider.value()
+        self._preview_timer.stop()
+        self._preview_frame = None
+        if self.capture_thread is None or self.total_frames <= 0:
+            return
+        self._show_frame_at(value)
+        self._set_slider_value(value)
+        if not self.video_paused:
+            self.capture_thread.resume()
 
     def seek_video(self, value):
         """Busca una posición específica en el video según el valor del deslizador."""
-        if self.cap and self.total_frames > 0:
-            frame_pos = int((value / 100) * self.total_frames)
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
-            self.current_frame = frame_pos
-            self.update_frame()
+        if self.capture_thread is not None and self.total_frames > 0:
+            self._show_frame_at(value)
 
     def closeEvent(self, event):
         """Se asegura de liberar los recursos al cerrar la aplicación."""
-        self.timer.stop()
-        if self.cap:
-            self.cap.release()
+        self._stop_capture()
+        self._release_camera()
+        if self._detector_loader.isRunning():
+            self._detector_loader.wait()
+        for worker in (self.findChildren(ImageWorker) + self.findChildren(VideoLoader) +
+                       self.findChildren(ModelLoader)):
+            worker.wait()
         event.accept()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.position_camera_sidebar()
-        if (hasattr(self, '_original_pixmap') and 
-            self._original_pixmap and not self._original_pixmap.isNull()):
-            scaled_pixmap = self._original_pixmap.scaled(
-                self.image_label.size() - QSize(10, 10),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
         if self.is_webcam_active:
             self.camera_sidebar.show()
             self.position_camera_sidebar()
@@ -931,27 +2035,6 @@ class EmotionDashboard(QWidget):
         else:
             self.camera_sidebar.hide()
 
-    def scale_image_to_label(self, qt_image):
-        """Escala la imagen para que ocupe el máximo espacio disponible manteniendo la proporción."""
-        pixmap = QPixmap.fromImage(qt_image)
-        
-        # Guarda el pixmap original para redimensionamiento posterior
-        self._original_pixmap = pixmap
-        
-        # Obtiene el tamaño disponible del label (con un pequeño margen)
-        available_size = self.image_label.size()
-        margin = 10
-        target_size = QSize(available_size.width() - margin, available_size.height() - margin)
-        
-        # Escala la imagen manteniendo la proporción
-        scaled_pixmap = pixmap.scaled(
-            target_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        
-        return scaled_pixmap
-
     def toggle_recording(self):
         if not self.is_webcam_active:
             return
@@ -994,15 +2077,13 @@ class EmotionDashboard(QWidget):
 
     def update_record_time(self):
         self.record_seconds += 1
-        mins = self.record_seconds // 60
-        secs = self.record_seconds % 60
-        self.record_time_label.setText(f"REC {mins:02}:{secs:02}")
+        self.record_time_label.setText(f"REC {format_time(self.record_seconds)}")
 
     def capture_image(self):
-        if not self.is_webcam_active:
+        if not self.is_webcam_active or self.capture_thread is None:
             return
-        ret, frame = self.cap.read()
-        if ret and frame is not None and frame.size > 0:
+        ret, frame, _ = self.capture_thread.read_frame()
+        if ret:
             h, w = frame.shape[:2]
             max_w, max_h = 640, 480
             scale = min(max_w / w, max_h / h, 1.0)
@@ -1023,12 +2104,29 @@ class EmotionDashboard(QWidget):
         self.sidebar.move(x, y)
 
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.Type.MouseMove:
+        if obj is self.image_label and event.type() == QEvent.Type.Resize:
+            size = event.size()
+            self._label_size = (max(1, size.width()), max(1, size.height()))
+            self._display_img = None
+            self._display_view = None
+            if self._last_frame is not None:
+                # Vista previa rápida (vecino más cercano) mientras dura el arrastre.
+                smooth = self._last_smooth
+                self._display(self._last_frame)
+                self._last_smooth = smooth
+                if smooth:
+                    self._resize_timer.start()
+        elif event.type() == QEvent.Type.MouseMove:
             if self.is_webcam_active:
                 pass 
              
         return super().eventFilter(obj, event)
 
+    def _apply_resize(self):
+        """Reescala con suavizado la imagen fija cuando terminó el redimensionado."""
+        if self._last_frame is not None and self._last_smooth:
+            self._display(self._last_frame, True)
+
     def position_camera_sidebar(self):
         il_w = self.image_label.width()
         il_h = self.image_label.height()
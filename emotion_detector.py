@@ -1,9 +1,58 @@
+import threading
 import cv2
 import numpy as np
 import torch
 from pathlib import Path
 from deepface import DeepFace
 
+def load_yolo_face_model(use_cuda=False):
+    """
+    Carga YOLOv8n-face desde el directorio del proyecto. Sin GPU CUDA, si existe la
+    exportación OpenVINO (`yolo export model=yolov8n-face.pt format=openvino`, que crea
+    `yolov8n-face_openvino_model/`), se usa esa: ultralytics la ejecuta con el runtime
+    de OpenVINO, más rápido en CPUs e iGPUs Intel que PyTorch.
+    Retorna (modelo, ruta cargada).
+    """
+    from ultralytics import YOLO
+    current_dir = Path(__file__).parent
+    openvino_dir = current_dir / 'yolov8n-face_openvino_model'
+    if not use_cuda and openvino_dir.is_dir():
+        try:
+            return YOLO(str(openvino_dir), task='detect'), str(openvino_dir)
+        except Exception as e:
+            print(f"[EmotionDetector] No se pudo cargar el modelo OpenVINO ({e}), se usará el .pt")
+    model_path = str(current_dir / 'yolov8n-face.pt')
+    return YOLO(model_path), model_path
+
+# Orden de las salidas del modelo de emociones de DeepFace.
+EMOTION_LABELS = ('angry', 'disgust', 'fear', 'happy', 'sad', 'surprise', 'neutral')
+
+def build_emotion_model():
+    """Devuelve el modelo Keras de emociones de DeepFace (la API cambió entre versiones)."""
+    try:
+        model = DeepFace.build_model(task="facial_attribute", model_name="Emotion")
+    except TypeError:
+        model = DeepFace.build_model("Emotion")
+    # Las versiones recientes envuelven el modelo Keras en un cliente.
+    return getattr(model, 'model', model)
+
+def load_emotion_int8_model():
+    """
+    Carga con ONNX Runtime el modelo de emociones cuantizado a INT8 que genera
+    `export_emotion_int8.py`. Retorna None si el archivo o onnxruntime no están disponibles.
+    """
+    model_path = Path(__file__).parent / 'emotion_int8.onnx'
+    if not model_path.exists():
+        return None
+    try:
+        import onnxruntime as ort
+        session = ort.InferenceSession(str(model_path), providers=['CPUExecutionProvider'])
+    except Exception as e:
+        print(f"[EmotionDetector] No se pudo cargar {model_path.name} ({e}), se usará DeepFace")
+        return None
+    print(f"[EmotionDetector] Modelo de emociones INT8 cargado desde: {model_path}")
+    return session
+
 class EmotionDetector:
     """
     Clase para detectar rostros y analizar emociones en imágenes y video.
@@ -26,7 +75,46 @@ class EmotionDetector:
             'surprise': 'Sorprendido',
             'neutral': 'Neutral'
         }
+        self.model_colors = {
+            'yolo': (0, 140, 255),       # Naranja (BGR)
+            'haar': (255, 200, 100),     # Celeste (BGR)
+            'mediapipe': (80, 220, 80),  # Verde (BGR)
+        }
         self.mediapipe_available = False
+        # Cada cuántos frames de video en vivo se ejecuta la detección completa.
+        self.detect_every = 3
+        # Máxima distancia de Hamming entre hashes para considerar dos frames casi iguales.
+        self.hash_threshold = 6
+        # Fracción de la resolución con la que se buscan rostros (1.0 = frame completo).
+        # Los recuadros se devuelven en coordenadas del frame original y la emoción se
+        # analiza sobre el recorte a resolución completa.
+        self.detection_scale = 1.0
+        # Confianza mínima para aceptar un recuadro de YOLO (0 = se aceptan todos).
+        self.yolo_conf_threshold = 0.0
+        # En los frames sin detección, los recuadros siguen al rostro con flujo óptico.
+        self.track_boxes = True
+        # Con GPU, YOLO procesa varios frames de un archivo de video en una sola pasada
+        # y se ejecuta en FP16. Solo cambia junto con el modelo (ver change_model).
+        self.cuda_available = torch.cuda.is_available()
+        self.use_cuda = self.cuda_available
+        self.batch_size = 8
+        # El detector puede usarse desde el hilo de captura y desde la GUI a la vez.
+        self.lock = threading.RLock()
+        # Buffers de trabajo reutilizados entre frames (ver _scratch).
+        self._buffers = {}
+        # (resolución de entrada, tamaño al que la reduce _limit_size o None si ya cabe);
+        # se calcula una vez por resolución, no en cada frame.
+        self._limit_cache = (None, None)
+        # Con OpenCL (iGPU/dGPU) el preprocesado se hace mediante cv2.UMat (Transparent API).
+        self.use_opencl = cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        # Modelo de emociones INT8 (ONNX Runtime); si no existe se usa DeepFace.
+        self._ort_sess = load_emotion_int8_model()
+        self.use_int8_emotion = self._ort_sess is not None
+        # Modelo Keras de DeepFace para clasificar todos los rostros de un frame en un
+        # solo lote; se construye al primer uso (False si no se pudo).
+        self._emotion_model = None
+        self.reset_stream()
         
         self.init_detectors()
 
@@ -38,14 +126,10 @@ class EmotionDetector:
             )
         elif self.model_type == "yolo":
             try:
-                from ultralytics import YOLO
-                # Buscar el modelo en el mismo directorio que este archivo
-                current_dir = Path(__file__).parent
-                model_path = str(current_dir / 'yolov8n-face.pt')
-                print(f"[EmotionDetector] Buscando modelo YOLOv8n-face en: {model_path}")
-                
-                # Cargar el modelo, si no existe se intentará descargar
-                self.detector = YOLO(model_path)
+                # Busca el modelo en el mismo directorio que este archivo; si no existe se
+                # intentará descargar.
+                self.detector, model_path = load_yolo_face_model(self.use_cuda)
+                print(f"[EmotionDetector] Modelo YOLOv8n-face cargado desde: {model_path}")
             except Exception:
                 self.model_type = "haar"
                 self.detector = cv2.CascadeClassifier(
@@ -89,9 +173,59 @@ class EmotionDetector:
             # Si DeepFace falla (ej. rostro no claro), devuelve 'Neutral'.
             return "Neutral", 0.5
 
+    def get_emotions(self, face_imgs):
+        """
+        Emoción de varios rostros con una sola pasada del modelo (INT8 o Keras).
+        Si el modelo no puede usarse directamente, analiza cada rostro con DeepFace.
+        """
+        if not face_imgs:
+            return []
+        try:
+            batch = self._emotion_batch(face_imgs)
+            if self.use_int8_emotion and self._ort_sess is not None:
+                input_name = self._ort_sess.get_inputs()[0].name
+                scores = self._ort_sess.run(None, {input_name: batch})[0]
+            else:
+                scores = self._keras_emotion_model().predict(batch, verbose=0)
+        except Exception:
+            return [self.get_emotion(self._resize_face(face)) for face in face_imgs]
+        best = scores.argmax(axis=1)
+        return [(self.emotion_translation[EMOTION_LABELS[i]], float(row[i])) for i, row in zip(best, scores)]
+
+    def _emotion_batch(self, face_imgs):
+        """Prepara los rostros como lo hace DeepFace: gris 48x48 normalizado a [0, 1]."""
+        batch = np.empty((len(face_imgs), 48, 48, 1), dtype=np.float32)
+        for i, face in enumerate(face_imgs):
+            gray = cv2.cvtColor(face, cv2.COLOR_BGR2GRAY, dst=self._scratch('emotion_gray', face.shape[:2]))
+            small = cv2.resize(gray, (48, 48), dst=self._scratch('emotion_small', (48, 48)),
+                               interpolation=cv2.INTER_AREA)
+            batch[i, :, :, 0] = small
+        batch /= 255.0
+        return batch
+
+    def _keras_emotion_model(self):
+        """Construye (una sola vez) el modelo Keras de emociones; lanza si no está disponible."""
+        if self._emotion_model is None:
+            try:
+                self._emotion_model = build_emotion_model()
+            except Exception as e:
+                print(f"[EmotionDetector] Sin inferencia por lotes ({e}), se usará DeepFace.analyze")
+                self._emotion_model = False
+        if self._emotion_model is False:
+            raise RuntimeError("Modelo de emociones no disponible")
+        return self._emotion_model
+
+    def _resize_face(self, face_img):
+        """Reescala un rostro a 224x224 para DeepFace.analyze."""
+        return cv2.resize(face_img, (224, 224), dst=self._scratch('face', (224, 224, 3)),
+                          interpolation=cv2.INTER_AREA)
+
     def detect_faces_haar(self, frame):
         """Detecta rostros usando Haar Cascade y devuelve las coordenadas."""
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if self.use_opencl:
+            gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY)
+        else:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._scratch('gray', frame.shape[:2]))
         faces = self.detector.detectMultiScale(
             gray, scaleFactor=1.1, minNeighbors=5, minSize=(30, 30)
         )
@@ -99,15 +233,30 @@ class EmotionDetector:
 
     def detect_faces_yolo(self, frame):
         """Detecta rostros usando YOLOv8n-face (ultralytics) y devuelve las coordenadas de los rostros."""
-        results = self.detector(frame)
+        results = self._run_yolo(frame)
         faces = []
         for r in results:
-            if hasattr(r, 'boxes') and r.boxes is not None:
-                for box, conf in zip(r.boxes.xyxy.cpu().numpy(), r.boxes.conf.cpu().numpy()):
-                    if conf > 0.5:
-                        x1, y1, x2, y2 = map(int, box)
-                        w, h = x2 - x1, y2 - y1
-                        faces.append((x1, y1, w, h))
+            faces.extend(self._yolo_faces(r))
+        return faces
+
+    def _run_yolo(self, source):
+        """Ejecuta YOLO en la GPU con FP16 (half) si está activada, o en la CPU."""
+        if self.use_cuda:
+            return self.detector(source, device=0, half=True, verbose=False)
+        return self.detector(source, device='cpu', verbose=False)
+
+    def _yolo_faces(self, result):
+        """
+        Convierte un resultado de ultralytics en una lista de (x, y, w, h), descartando
+        los recuadros con confianza menor que `yolo_conf_threshold`.
+        """
+        faces = []
+        if hasattr(result, 'boxes') and result.boxes is not None:
+            for box, conf in zip(result.boxes.xyxy.cpu().numpy(), result.boxes.conf.cpu().numpy()):
+                if conf >= self.yolo_conf_threshold:
+                    x1, y1, x2, y2 = map(int, box)
+                    w, h = x2 - x1, y2 - y1
+                    faces.append((x1, y1, w, h))
         return faces
 
     def detect_faces_mediapipe(self, frame):
@@ -115,7 +264,7 @@ class EmotionDetector:
         if not self.mediapipe_available:
             return []
 
-        img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        img_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._scratch('rgb', frame.shape))
         # El objeto FaceDetection NO es invocable, debe usarse .process()
         results = self.detector.process(img_rgb)
 
@@ -128,85 +277,248 @@ class EmotionDetector:
                 faces.append((x, y, width, height))
         return faces
 
-    def process_frame(self, frame):
+    def detect(self, frame):
         """
-        Procesa un frame de video o una imagen: detecta rostros y sus emociones.
-        Si el modelo es YOLO, dibuja los resultados y muestra la emoción dominante sobre cada rostro.
-        Optimizado para resolución media y fluidez.
+        Detecta los rostros del frame y la emoción de cada uno.
+        Retorna una lista de tuplas (x, y, w, h, emoción) en coordenadas del frame.
         """
-        if frame is None or frame.size == 0:
-            return frame
-        # --- Reescalar a resolución media (máx 640x480) ---
-        h, w = frame.shape[:2]
-        max_w, max_h = 640, 480
-        scale = min(max_w / w, max_h / h, 1.0)
-        if scale < 1.0:
-            frame = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA)
-        try:
+        with self.lock:
+            small = self._detection_input(frame, self._scratch)
             if self.model_type == "yolo":
-                results = self.detector(frame)
-                annotated = frame.copy()
-                for box in results[0].boxes.xyxy.cpu().numpy():
-                    x1, y1, x2, y2 = map(int, box)
-                    face_img = frame[y1:y2, x1:x2]
-                    if face_img.size > 0:
-                        # --- Reescalar rostro a 224x224 para DeepFace ---
-                        face_resized = cv2.resize(face_img, (224, 224), interpolation=cv2.INTER_AREA)
-                        try:
-                            emotion = DeepFace.analyze(face_resized, actions=['emotion'], enforce_detection=False)
-                            emotion_label = emotion[0]['dominant_emotion'] if isinstance(emotion, list) else emotion['dominant_emotion']
-                            emotion_label = self.emotion_translation.get(emotion_label.lower(), emotion_label)
-                            color = (0, 140, 255)  # Naranja (BGR)
-                            cv2.rectangle(annotated, (x1, y1), (x2, y2), color, 2)
-                            cv2.putText(annotated, emotion_label, (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
-                        except Exception:
-                            cv2.putText(annotated, 'Error', (x1, y1-10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0,0,255), 2)
-                return annotated
+                faces = self.detect_faces_yolo(small)
             elif self.model_type == "haar":
-                faces = self.detect_faces_haar(frame)
-                color = (255, 200, 100)  # Celeste (BGR)
+                faces = self.detect_faces_haar(small)
             elif self.model_type == "mediapipe":
-                faces = self.detect_faces_mediapipe(frame)
-                color = (80, 220, 80)  # Verde (BGR)
+                faces = self.detect_faces_mediapipe(small)
             else:
                 faces = []
-                color = (0, 255, 0)
-            for (x, y, w, h) in faces:
-                h_frame, w_frame = frame.shape[:2]
-                x = max(0, min(x, w_frame - 1))
-                y = max(0, min(y, h_frame - 1))
-                w = max(1, min(w, w_frame - x))
-                h = max(1, min(h, h_frame - y))
-                face_img = frame[y:y+h, x:x+w]
-                if face_img.size == 0:
-                    continue
-                # --- Reescalar rostro a 224x224 para DeepFace ---
-                face_resized = cv2.resize(face_img, (224, 224), interpolation=cv2.INTER_AREA)
-                emotion, confidence = self.get_emotion(face_resized)
-                cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
-                text = f"{emotion}"
-                (text_width, text_height), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.9, 2)
-                cv2.putText(frame, text, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
+            return self._classify_faces(frame, self._scale_faces(faces, small, frame))
+
+    def _detection_input(self, frame, scratch=None):
+        """
+        Reduce el frame según `detection_scale` antes de buscar rostros. Con `scratch`
+        el resultado se escribe en un buffer reutilizado.
+        """
+        if self.detection_scale >= 1.0:
+            return frame
+        h, w = frame.shape[:2]
+        size = (max(1, int(w * self.detection_scale)), max(1, int(h * self.detection_scale)))
+        dst = scratch('detect_small', (size[1], size[0], 3)) if scratch else None
+        return cv2.resize(frame, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _scale_faces(faces, small, frame):
+        """Lleva los recuadros detectados en `small` a coordenadas de `frame`."""
+        if small is frame:
+            return faces
+        sx = frame.shape[1] / small.shape[1]
+        sy = frame.shape[0] / small.shape[0]
+        return [(int(x * sx), int(y * sy), int(w * sx), int(h * sy)) for (x, y, w, h) in faces]
+
+    def _classify_faces(self, frame, faces):
+        """
+        Recorta cada rostro (ajustado a los bordes del frame) y obtiene la emoción de
+        todos ellos en un solo lote.
+        """
+        h_frame, w_frame = frame.shape[:2]
+        boxes = []
+        crops = []
+        for (x, y, w, h) in faces:
+            x = max(0, min(x, w_frame - 1))
+            y = max(0, min(y, h_frame - 1))
+            w = max(1, min(w, w_frame - x))
+            h = max(1, min(h, h_frame - y))
+            face_img = frame[y:y+h, x:x+w]
+            if face_img.size == 0:
+                continue
+            boxes.append((x, y, w, h))
+            crops.append(face_img)
+        emotions = self.get_emotions(crops)
+        return [(x, y, w, h, emotion) for (x, y, w, h), (emotion, _) in zip(boxes, emotions)]
+
+    @property
+    def batch_capable(self):
+        """True si conviene agrupar frames en lotes (YOLO ejecutándose en GPU)."""
+        return self.model_type == "yolo" and self.use_cuda
+
+    def detect_batch(self, frames):
+        """
+        Igual que detect, pero para una lista de frames. Con YOLO todos los frames
+        se pasan al modelo en una sola llamada para aprovechar la GPU.
+        """
+        with self.lock:
+            if self.model_type != "yolo":
+                return [self.detect(frame) for frame in frames]
+            smalls = [self._detection_input(frame) for frame in frames]
+            results = self._run_yolo(smalls)
+            return [self._classify_faces(frame, self._scale_faces(self._yolo_faces(r), small, frame))
+                    for frame, small, r in zip(frames, smalls, results)]
+
+    def draw(self, frame, detections):
+        """Dibuja sobre el frame (in-place) el recuadro y la emoción de cada detección."""
+        color = self.model_colors.get(self.model_type, (0, 255, 0))
+        for (x, y, w, h, emotion) in detections:
+            cv2.rectangle(frame, (x, y), (x+w, y+h), color, 2)
+            cv2.putText(frame, emotion, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.9, color, 2)
+        return frame
+
+    def _limit_size(self, frame):
+        """Reescala el frame a resolución media (máx 640x480) para mantener la fluidez."""
+        key = frame.shape[:2]
+        cached_key, size = self._limit_cache
+        if key != cached_key:
+            h, w = key
+            max_w, max_h = 640, 480
+            scale = min(max_w / w, max_h / h, 1.0)
+            size = (int(w * scale), int(h * scale)) if scale < 1.0 else None
+            # Una sola asignación: otro hilo nunca ve una clave con el tamaño de otra.
+            self._limit_cache = (key, size)
+        if size is not None:
+            if self.use_opencl:
+                # El resultado se descarga a memoria del host una sola vez.
+                frame = cv2.resize(cv2.UMat(frame), size, interpolation=cv2.INTER_AREA).get()
+            else:
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+        return frame
+
+    def process_frame(self, frame):
+        """
+        Procesa un frame de video o una imagen: detecta rostros y sus emociones
+        y dibuja los resultados sobre cada rostro.
+        Optimizado para resolución media y fluidez.
+        El trabajo pesado (OpenCV, YOLO, DeepFace/ONNX Runtime) libera el GIL, así que
+        puede llamarse desde un hilo de trabajo sin bloquear la GUI.
+        """
+        if frame is None or frame.size == 0:
+            return frame
+        frame = self._limit_size(frame)
+        try:
+            self.draw(frame, self.detect(frame))
         except Exception:
             # Solo mostrar error amigable, no traceback
             pass
         return frame
 
-    def change_model(self, model_name):
+    def process_stream_frame(self, frame):
+        """
+        Igual que process_frame, pero pensado para video en vivo: la detección completa
+        solo se ejecuta cada `detect_every` frames y en los intermedios se reutilizan
+        las emociones de la última detección, desplazando los recuadros con flujo óptico
+        (si `track_boxes` está activo) para que sigan al rostro.
+        """
+        if frame is None or frame.size == 0:
+            return frame
+        frame = self._limit_size(frame)
+        try:
+            with self.lock:
+                gray = self._track_gray(frame) if self.track_boxes else None
+                if self._last_detections is None or self._stream_count % self.detect_every == 0:
+                    frame_hash = self.frame_hash(frame)
+                    # Si la escena apenas cambió desde la última detección, se reutiliza el resultado.
+                    if (self._last_hash is None or self._last_detections is None or
+                            bin(frame_hash ^ self._last_hash).count('1') > self.hash_threshold):
+                        self._last_detections = self.detect(frame)
+                        self._last_hash = frame_hash
+                elif gray is not None:
+                    self._last_detections = self._track_detections(self._prev_gray, gray)
+                self._prev_gray = gray
+                self._stream_count += 1
+                self.draw(frame, self._last_detections)
+        except Exception:
+            pass
+        return frame
+
+    def process_frame_batch(self, frames):
+        """Versión por lotes de process_frame. Retorna la lista de frames anotados."""
+        frames = [self._limit_size(frame) for frame in frames]
+        try:
+            for frame, detections in zip(frames, self.detect_batch(frames)):
+                self.draw(frame, detections)
+        except Exception:
+            pass
+        return frames
+
+    def _scratch(self, name, shape):
+        """
+        Devuelve un buffer uint8 reutilizable para resultados intermedios que no salen
+        del detector; solo se vuelve a reservar si cambia la forma.
+        """
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=np.uint8)
+            self._buffers[name] = buf
+        return buf
+
+    def _track_gray(self, frame):
+        """
+        Escala de grises del frame para el seguimiento. Se alternan dos buffers porque
+        el frame anterior debe seguir intacto mientras se calcula el flujo.
+        """
+        self._gray_slot ^= 1
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY,
+                            dst=self._scratch(f'track_gray{self._gray_slot}', frame.shape[:2]))
+
+    def _track_detections(self, prev_gray, gray):
+        """
+        Desplaza cada recuadro de la última detección según el movimiento mediano de
+        sus puntos característicos (Lucas-Kanade). La emoción se conserva.
+        """
+        if prev_gray is None or prev_gray.shape != gray.shape:
+            return self._last_detections
+        frame_h, frame_w = gray.shape
+        tracked = []
+        for (x, y, w, h, emotion) in self._last_detections:
+            points = cv2.goodFeaturesToTrack(prev_gray[y:y + h, x:x + w], maxCorners=20,
+                                             qualityLevel=0.01, minDistance=5)
+            if points is not None:
+                points = points + np.array([x, y], dtype=np.float32)
+                moved, status, _ = cv2.calcOpticalFlowPyrLK(prev_gray, gray, points, None)
+                ok = status.ravel() == 1
+                if ok.any():
+                    dx, dy = np.median((moved - points)[ok].reshape(-1, 2), axis=0)
+                    x = int(min(max(0, x + dx), frame_w - w))
+                    y = int(min(max(0, y + dy), frame_h - h))
+            tracked.append((x, y, w, h, emotion))
+        return tracked
+
+    def reset_stream(self):
+        """Olvida las detecciones reutilizadas (p. ej. al cambiar de fuente o de modelo)."""
+        with self.lock:
+            self._last_detections = None
+            self._last_hash = None
+            self._stream_count = 0
+            self._prev_gray = None
+            self._gray_slot = 0
+
+    def frame_hash(self, frame):
+        """Hash perceptual de 64 bits (promedio de una miniatura 8x8 en escala de grises)."""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._scratch('hash_gray', frame.shape[:2]))
+        small = cv2.resize(gray, (8, 8), dst=self._scratch('hash_small', (8, 8)),
+                           interpolation=cv2.INTER_AREA)
+        bits = np.packbits(small > small.mean())
+        return int.from_bytes(bits.tobytes(), 'big')
+
+    def change_model(self, model_name, use_gpu=None):
         """
         Cambia dinámicamente el modelo de detección de rostros.
+        Con `use_gpu` se fija además si el nuevo modelo usará la GPU; el ajuste cambia
+        bajo el mismo lock que el modelo, así nunca se ejecuta un modelo con el de otro.
         Retorna True si el cambio fue exitoso, False en caso contrario.
         """
         if model_name not in ["haar", "yolo", "mediapipe"]:
             return False
         
-        self.model_type = model_name
-        try:
-            self.init_detectors()
-            return True
-        except Exception as e:
-            print(f"Error al cambiar al modelo {model_name}: {e}")
-            # Si falla, revierte a Haar Cascade como modelo seguro.
-            self.model_type = "haar"
-            self.init_detectors()
-            return False
+        with self.lock:
+            if use_gpu is not None:
+                self.use_cuda = use_gpu and self.cuda_available
+            self.model_type = model_name
+            self.reset_stream()
+            try:
+                self.init_detectors()
+                return True
+            except Exception as e:
+                print(f"Error al cambiar al modelo {model_name}: {e}")
+                # Si falla, revierte a Haar Cascade como modelo seguro.
+                self.model_type = "haar"
+                self.init_detectors()
+                return False
@@ -0,0 +1,32 @@
+"""
+Exporta el modelo de emociones de DeepFace a ONNX y lo cuantiza a INT8.
+El resultado (`emotion_int8.onnx`) lo carga EmotionDetector con ONNX Runtime.
+
+Uso:
+    pip install tf2onnx onnxruntime
+    python export_emotion_int8.py
+"""
+from pathlib import Path
+
+import tensorflow as tf
+import tf2onnx
+from onnxruntime.quantization import quantize_dynamic, QuantType
+
+from emotion_detector import build_emotion_model
+
+CURRENT_DIR = Path(__file__).parent
+FP32_PATH = CURRENT_DIR / 'emotion_fp32.onnx'
+INT8_PATH = CURRENT_DIR / 'emotion_int8.onnx'
+
+
+def main():
+    keras_model = build_emotion_model()
+    spec = (tf.TensorSpec((None, 48, 48, 1), tf.float32, name='input'),)
+    tf2onnx.convert.from_keras(keras_model, input_signature=spec, opset=13, output_path=str(FP32_PATH))
+    quantize_dynamic(str(FP32_PATH), str(INT8_PATH), weight_type=QuantType.QInt8)
+    FP32_PATH.unlink()
+    print(f"Modelo INT8 guardado en: {INT8_PATH}")
+
+
+if __name__ == '__main__':
+    main()